@@ -19,12 +19,59 @@ APP_SOCK = os.getenv("TRUFFLE_APP_SOCKET", "unix:///tmp/truffle_app.sock")
 SDK_SOCK = os.getenv("TRUFFLE_SDK_SOCKET", "unix:///tmp/truffle_sdk.sock")
 SHARED_FILES_DIR = os.getenv("TRUFFLE_SHARED_DIR", "/root/shared")  # container default 1.31.25
 
+# Channel configuration
+MAX_MESSAGE_LENGTH = 64 * 1024 * 1024
+DEFAULT_WRITE_BUFFER_SIZE = 64 * 1024
+
+def channel_options(
+    streaming_latency_sensitive: bool = False,
+) -> typing.List[typing.Tuple[str, int]]:
+    """
+    Build gRPC channel options for the local socket transport.
+
+    Keepalive pings are disabled since the peer lives on the same host, and
+    the message size limits are raised to fit large tool payloads.
+
+    Args:
+        streaming_latency_sensitive: Disable HTTP/2 write buffering so each
+            streamed token is flushed immediately. This trades throughput
+            for per-token latency.
+
+    Returns:
+        List of (option, value) pairs for grpc.insecure_channel
+    """
+    return [
+        ("grpc.keepalive_time_ms", 2**31 - 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+        ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
+        (
+            "grpc.http2.write_buffer_size",
+            0 if streaming_latency_sensitive else DEFAULT_WRITE_BUFFER_SIZE,
+        ),
+    ]
+
 class TruffleClient:
     """Provides a pythonic interface to access the core functionality of the platform."""
     
-    def __init__(self, host: str = SDK_SOCK):
-        """Initialize the client with an optional host address."""
-        self.channel = grpc.insecure_channel(host)
+    def __init__(
+        self,
+        host: str = SDK_SOCK,
+        streaming_latency_sensitive: bool = False,
+        compression: typing.Optional[grpc.Compression] = None,
+    ):
+        """
+        Initialize the client with an optional host address.
+
+        Compression is off by default: on the local socket it usually costs
+        more latency than it saves. Pass grpc.Compression.Gzip when talking to
+        a remote host or sending large perplexity_search payloads.
+        """
+        self.channel = grpc.insecure_channel(
+            host,
+            options=channel_options(streaming_latency_sensitive),
+            compression=compression,
+        )
         self.stub = sdk_pb2_grpc.TruffleSDKStub(self.channel)
         self.model_contexts: typing.List[sdk_pb2.Context] = []
 
@@ -134,7 +181,9 @@ class TruffleClient:
             ret = {"response": response.response}
             if response.HasField("error"):
                 ret["error"] = response.error
-            if response.HasField("attached_files") and len(response.attached_files):
+            # Repeated fields have no presence; copy so the result doesn't
+            # keep the response message alive
+            if response.attached_files:
                 ret["files"] = list(response.attached_files)
             return ret
         except grpc.RpcError as e:
@@ -238,6 +287,12 @@ class TruffleClient:
 
         try:
             for response in self.stub.Infer(request):
+                # Fast path: a plain token with no error or finish reason
+                token = response.token
+                if token and not response.error and not response.finish_reason:
+                    yield token
+                    continue
+
                 if response.error:
                     raise RuntimeError(f"Generation error: {response.error}")
 
@@ -246,8 +301,8 @@ class TruffleClient:
                         raise RuntimeError("Generation terminated with error")
                     break
 
-                if response.token:
-                    yield response.token
+                if token:
+                    yield token
 
         except grpc.RpcError as e:
             raise RuntimeError(f"RPC error: {e.details()}")
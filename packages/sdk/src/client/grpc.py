@@ -8,18 +8,22 @@ Core implementation of the gRPC client for the Truffle platform:
 - Type-safe interfaces
 """
 
+import functools
+import inspect
 import typing
 import grpc
 from typing import Iterator, List, Optional, Dict, Union, Tuple
 
 from ..platform import sdk_pb2, sdk_pb2_grpc
-from .base import TruffleClient, SDK_SOCK
+from .base import TruffleClient, SDK_SOCK, channel_options
 from .types import (
     ClientConfig,
     ModelConfig,
     ContextConfig,
     RuntimeValidator,
     ResponseValidator,
+    validate_model_config,
+    validate_context_config,
 )
 from .exceptions import (
     ConnectionError,
@@ -29,27 +33,71 @@ from .exceptions import (
 )
 
 
+def _translate_rpc_errors(message: str) -> typing.Callable:
+    """
+    Decorator mapping grpc.RpcError raised by a client method to ConnectionError.
+    
+    Generator methods are wrapped so that errors raised while the caller
+    iterates the stream are translated as well.
+    
+    Args:
+        message: Error message used for the raised ConnectionError
+    """
+    def decorator(func: typing.Callable) -> typing.Callable:
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def stream_wrapper(*args, **kwargs):
+                try:
+                    yield from func(*args, **kwargs)
+                except grpc.RpcError as e:
+                    raise ConnectionError(message, str(e))
+            return stream_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except grpc.RpcError as e:
+                raise ConnectionError(message, str(e))
+        return wrapper
+    return decorator
+
+
 class GRPCClient(TruffleClient):
     """gRPC implementation of the Truffle client."""
     
-    def __init__(self, host: str = SDK_SOCK):
+    def __init__(
+        self,
+        host: str = SDK_SOCK,
+        streaming_latency_sensitive: bool = False,
+        compression: Optional[grpc.Compression] = None,
+    ):
         """
         Initialize the gRPC client.
         
         Args:
             host: gRPC server address
+            streaming_latency_sensitive: Flush streamed tokens immediately
+                instead of buffering writes (lower latency, less throughput)
+            compression: Optional channel compression (e.g.
+                grpc.Compression.Gzip); off by default for the local socket
             
         Raises:
             ConnectionError: If connection fails
             ValidationError: If client validation fails
         """
         self.config = ClientConfig(host=host)
-        self.channel = grpc.insecure_channel(host)
+        self.channel = grpc.insecure_channel(
+            host,
+            options=channel_options(streaming_latency_sensitive),
+            compression=compression,
+        )
         self.stub = sdk_pb2_grpc.TruffleStub(self.channel)
         
         # Validate client on initialization
         RuntimeValidator.validate_client(self)
     
+    @_translate_rpc_errors("Perplexity search failed")
     def perplexity_search(
         self,
         query: str,
@@ -73,25 +121,22 @@ class GRPCClient(TruffleClient):
             ValidationError: If parameters are invalid
             ConnectionError: If request fails
         """
-        try:
-            request = sdk_pb2.PerplexityRequest(
-                query=query,
-                model=model,
-                system_prompt=system_prompt,
-            )
-            if response_fmt:
-                request.response_format.update(response_fmt)
-                
-            response = self.stub.PerplexitySearch(request)
+        request = sdk_pb2.PerplexityRequest(
+            query=query,
+            model=model,
+            system_prompt=system_prompt,
+        )
+        if response_fmt:
+            request.response_format.update(response_fmt)
             
-            if response.error:
-                raise ValidationError(response.error)
-                
-            return response.response
-
-        except grpc.RpcError as e:
-            raise ConnectionError("Perplexity search failed", str(e))
+        response = self.stub.PerplexitySearch(request)
+        
+        if response.error:
+            raise ValidationError(response.error)
+            
+        return response.response
     
+    @_translate_rpc_errors("Failed to get models")
     def get_models(self) -> List[sdk_pb2.ModelDescription]:
         """
         Get available models.
@@ -102,20 +147,17 @@ class GRPCClient(TruffleClient):
         Raises:
             ConnectionError: If request fails
         """
-        try:
-            response = self.stub.GetModels(sdk_pb2.GetModelsRequest())
-            
-            # Validate each model
-            models = []
-            for model in response.models:
-                if ResponseValidator.validate_model_response(model):
-                    models.append(model)
-                    
-            return models
-            
-        except grpc.RpcError as e:
-            raise ConnectionError("Failed to get models", str(e))
+        response = self.stub.GetModels(sdk_pb2.GetModelsRequest())
+        
+        # Validate each model
+        models = []
+        for model in response.models:
+            if ResponseValidator.validate_model_response(model):
+                models.append(model)
+                
+        return models
     
+    @_translate_rpc_errors("Tool update failed")
     def tool_update(self, message: str) -> None:
         """
         Send a tool update.
@@ -126,11 +168,9 @@ class GRPCClient(TruffleClient):
         Raises:
             ConnectionError: If update fails
         """
-        try:
-            self.stub.ToolUpdate(sdk_pb2.ToolUpdateRequest(message=message))
-        except grpc.RpcError as e:
-            raise ConnectionError("Tool update failed", str(e))
+        self.stub.ToolUpdate(sdk_pb2.ToolUpdateRequest(message=message))
     
+    @_translate_rpc_errors("User request failed")
     def ask_user(
         self, 
         message: str, 
@@ -149,24 +189,21 @@ class GRPCClient(TruffleClient):
         Raises:
             ConnectionError: If request fails
         """
-        try:
-            request = sdk_pb2.UserRequest(
-                message=message,
-                reason=reason
-            )
-            response = self.stub.AskUser(request)
-            
-            if response.error:
-                raise ValidationError(response.error)
-                
-            return {
-                "response": response.response,
-                "options": list(response.options)
-            }
+        request = sdk_pb2.UserRequest(
+            message=message,
+            reason=reason
+        )
+        response = self.stub.AskUser(request)
+        
+        if response.error:
+            raise ValidationError(response.error)
             
-        except grpc.RpcError as e:
-            raise ConnectionError("User request failed", str(e))
+        return {
+            "response": response.response,
+            "options": list(response.options)
+        }
     
+    @_translate_rpc_errors("Embedding query failed")
     def query_embed(
         self, 
         query: str, 
@@ -186,21 +223,18 @@ class GRPCClient(TruffleClient):
             ConnectionError: If request fails
             ValidationError: If response is invalid
         """
-        try:
-            request = sdk_pb2.EmbedRequest(
-                query=query,
-                documents=documents
-            )
-            response = self.stub.QueryEmbed(request)
-            
-            if not ResponseValidator.validate_embed_response(response):
-                raise ValidationError("Invalid embedding response")
-                
-            return [(r.text, r.score) for r in response.results]
+        request = sdk_pb2.EmbedRequest(
+            query=query,
+            documents=documents
+        )
+        response = self.stub.QueryEmbed(request)
+        
+        if not ResponseValidator.validate_embed_response(response):
+            raise ValidationError("Invalid embedding response")
             
-        except grpc.RpcError as e:
-            raise ConnectionError("Embedding query failed", str(e))
+        return [(r.text, r.score) for r in response.results]
     
+    @_translate_rpc_errors("Generation failed")
     def infer(
         self,
         prompt: str,
@@ -250,33 +284,39 @@ class GRPCClient(TruffleClient):
         )
         validate_context_config(context_config)
         
-        try:
-            request = sdk_pb2.GenerateRequest(
-                prompt=prompt,
-                model_id=model_id,
-                system_prompt=system_prompt or "",
-                context_idx=context_idx or 0,
-                max_tokens=max_tokens,
-                temperature=temperature
-            )
+        request = sdk_pb2.GenerateRequest(
+            prompt=prompt,
+            model_id=model_id,
+            system_prompt=system_prompt or "",
+            context_idx=context_idx or 0,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        
+        if format_type:
+            request.format_type = format_type
+        if schema:
+            request.schema = schema
             
-            if format_type:
-                request.format_type = format_type
-            if schema:
-                request.schema = schema
+        finish_error = sdk_pb2.GenerateFinishReason.FINISH_REASON_ERROR
+        for response in self.stub.Generate(request):
+            # Fast path: a plain token with no error or error finish
+            token = response.token
+            if (
+                token and not response.error and
+                response.finish_reason != finish_error
+            ):
+                yield token
+                continue
+
+            if response.error:
+                raise GenerationError(response.error)
+                
+            if not ResponseValidator.validate_generation_response(response):
+                raise ValidationError("Invalid generation response")
                 
-            for response in self.stub.Generate(request):
-                if response.error:
-                    raise GenerationError(response.error)
-                    
-                if not ResponseValidator.validate_generation_response(response):
-                    raise ValidationError("Invalid generation response")
-                    
-                if response.token:
-                    yield response.token
-                    
-        except grpc.RpcError as e:
-            raise ConnectionError("Generation failed", str(e))
+            if token:
+                yield token
     
     def close(self) -> None:
         """Close the client connection."""
@@ -79,6 +79,23 @@ class ResponseValidator:
         )
 
 
+# Proto enum value -> Python return type, built on first use because
+# types.models imports this package.
+_PROTO_TYPE_TABLE: typing.Optional[typing.Tuple[typing.Type['TruffleReturnType'], ...]] = None
+
+
+def _get_proto_type_table() -> typing.Tuple[typing.Type['TruffleReturnType'], ...]:
+    """Build (once) the tuple indexed by TruffleType enum value."""
+    global _PROTO_TYPE_TABLE
+    if _PROTO_TYPE_TABLE is None:
+        from ..types.models import TruffleFile, TruffleImage, TruffleReturnType
+        table = [TruffleReturnType] * (max(sdk_pb2.TruffleType.values()) + 1)
+        table[sdk_pb2.TruffleType.TRUFFLE_FILE] = TruffleFile
+        table[sdk_pb2.TruffleType.TRUFFLE_IMAGE] = TruffleImage
+        _PROTO_TYPE_TABLE = tuple(table)
+    return _PROTO_TYPE_TABLE
+
+
 class TypeConverter:
     """Utilities for type conversion."""
 
@@ -90,12 +107,10 @@ class TypeConverter:
     @staticmethod
     def from_proto_type(type_enum: sdk_pb2.TruffleType) -> typing.Type['TruffleReturnType']:
         """Get Python type from proto enum."""
-        from ..types.models import TruffleFile, TruffleImage, TruffleReturnType
-        type_map = {
-            sdk_pb2.TruffleType.TRUFFLE_TYPE_FILE: TruffleFile,
-            sdk_pb2.TruffleType.TRUFFLE_TYPE_IMAGE: TruffleImage,
-        }
-        return type_map.get(type_enum, TruffleReturnType)
+        table = _PROTO_TYPE_TABLE or _get_proto_type_table()
+        if 0 <= type_enum < len(table):
+            return table[type_enum]
+        return table[sdk_pb2.TruffleType.TRUFFLE_UNSPECIFIED]
 
 
 def validate_client_config(config: ClientConfig) -> None:
@@ -128,17 +143,24 @@ def validate_context_config(config: ContextConfig) -> None:
         raise ValueError("System prompt cannot be empty if provided") 
 
 
-@dataclasses.dataclass
 class RuntimeValidator:
     """Runtime validation utilities for client operations."""
     
     @staticmethod
-    def validate_client(client: 'TruffleClient') -> None:
+    def validate_client(
+        client: 'TruffleClient',
+        timeout: typing.Optional[float] = None,
+        deep: bool = False,
+    ) -> None:
         """
         Validate client configuration and connection.
         
         Args:
             client: TruffleClient instance to validate
+            timeout: Seconds to wait for the channel to become ready;
+                None (the default) skips the wait so construction never
+                blocks on an unreachable server
+            deep: Also issue a get_models() call to exercise the service
             
         Raises:
             ValidationError: If client configuration is invalid
@@ -150,9 +172,25 @@ class RuntimeValidator:
         if not client.stub:
             raise ValidationError("Client stub not initialized")
             
-        # Test connection
+        # Test connection (transport handshake only), if asked to
+        if timeout is not None:
+            ready = grpc.channel_ready_future(client.channel)
+            try:
+                ready.result(timeout=timeout)
+            except grpc.FutureTimeoutError:
+                raise ConnectionError(
+                    "Failed to connect to Truffle service",
+                    f"channel not ready after {timeout}s"
+                )
+            finally:
+                # Stop watching the channel's connectivity
+                ready.cancel()
+
+        if not deep:
+            return
+
         try:
-            # Attempt to list models as connection test
+            # Round-trip a real RPC to check the service itself
             client.get_models()
         except grpc.RpcError as e:
             raise ConnectionError(
@@ -160,4 +198,4 @@ class RuntimeValidator:
                 str(e)
             )
         except Exception as e:
-            raise ValidationError(f"Client validation failed: {str(e)}") 
\ No newline at end of file
+            raise ValidationError(f"Client validation failed: {str(e)}")
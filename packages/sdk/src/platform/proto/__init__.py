@@ -13,6 +13,7 @@ from .converters import (
     from_proto_type,
     to_proto_content,
     from_proto_content,
+    from_proto_contents,
     to_proto_request,
     from_proto_response,
     to_proto_app_metadata,
@@ -40,6 +41,7 @@ __all__ = [
     "from_proto_type",
     "to_proto_content",
     "from_proto_content",
+    "from_proto_contents",
     "to_proto_request",
     "from_proto_response",
     "to_proto_app_metadata",
@@ -8,9 +8,14 @@ This module provides conversion functions between Python types and protobuf mess
 - Metadata conversion utilities
 """
 
+import base64
+import os
 import typing
+import warnings
 from dataclasses import asdict as dataclass_asdict
 from google.protobuf import json_format
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.internal import api_implementation, type_checkers
 
 from ...types.models import (
     TruffleReturnType,
@@ -20,7 +25,39 @@ from ...types.models import (
     AppMetadata,
 )
 from .. import sdk_pb2
-from ...client.exceptions import ValidationError
+from ...client.exceptions import ValidationError, ConfigurationError
+
+# The pure-Python protobuf backend is 10-100x slower than the compiled
+# (upb/cpp) ones. Set TRUFFLE_REQUIRE_CPP_PROTOBUF=1 to make it an error.
+if api_implementation.Type() == "python":
+    if os.getenv("TRUFFLE_REQUIRE_CPP_PROTOBUF"):
+        raise ConfigurationError(
+            "The compiled protobuf backend is required but the pure-Python "
+            "implementation is loaded; install the protobuf wheel for your "
+            "platform and unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION"
+        )
+    warnings.warn(
+        "Using the pure-Python protobuf implementation; proto conversion "
+        "will be slow",
+        RuntimeWarning,
+    )
+
+# Conversion tables
+_PROTO_TO_PY_TYPE = {
+    cls.__truffle_proto_type__: cls for cls in (TruffleFile, TruffleImage)
+}
+_TRUFFLE_UNSPECIFIED = sdk_pb2.TruffleType.TRUFFLE_UNSPECIFIED
+
+_ROLE_TO_PROTO = {
+    "system": sdk_pb2.Content.ROLE_SYSTEM,
+    "user": sdk_pb2.Content.ROLE_USER,
+    "ai": sdk_pb2.Content.ROLE_AI,
+}
+_PROTO_TO_ROLE = {
+    sdk_pb2.Content.ROLE_SYSTEM: "system",
+    sdk_pb2.Content.ROLE_USER: "user",
+    sdk_pb2.Content.ROLE_AI: "ai",
+}
 
 def to_proto_type(obj: TruffleReturnType) -> sdk_pb2.TruffleType:
     """
@@ -35,11 +72,10 @@ def to_proto_type(obj: TruffleReturnType) -> sdk_pb2.TruffleType:
     Raises:
         ValidationError: If type conversion fails
     """
-    type_map = {
-        TruffleFile: sdk_pb2.TruffleType.TRUFFLE_TYPE_FILE,
-        TruffleImage: sdk_pb2.TruffleType.TRUFFLE_TYPE_IMAGE,
-    }
-    return type_map.get(type(obj), sdk_pb2.TruffleType.TRUFFLE_TYPE_UNSPECIFIED)
+    if isinstance(obj, TruffleReturnType):
+        # The instance's type, which callers may set explicitly
+        return obj.type
+    return _TRUFFLE_UNSPECIFIED
 
 def from_proto_type(type_enum: sdk_pb2.TruffleType) -> typing.Type[TruffleReturnType]:
     """
@@ -54,11 +90,7 @@ def from_proto_type(type_enum: sdk_pb2.TruffleType) -> typing.Type[TruffleReturn
     Raises:
         ValidationError: If type conversion fails
     """
-    type_map = {
-        sdk_pb2.TruffleType.TRUFFLE_TYPE_FILE: TruffleFile,
-        sdk_pb2.TruffleType.TRUFFLE_TYPE_IMAGE: TruffleImage,
-    }
-    return type_map.get(type_enum, TruffleReturnType)
+    return _PROTO_TO_PY_TYPE.get(type_enum, TruffleReturnType)
 
 def to_proto_content(
     role: str,
@@ -79,12 +111,9 @@ def to_proto_content(
     Raises:
         ValidationError: If role is invalid
     """
-    role_map = {
-        "system": sdk_pb2.Content.ROLE_SYSTEM,
-        "user": sdk_pb2.Content.ROLE_USER,
-        "ai": sdk_pb2.Content.ROLE_AI,
-    }
-    proto_role = role_map.get(role.lower())
+    proto_role = _ROLE_TO_PROTO.get(role)
+    if proto_role is None:
+        proto_role = _ROLE_TO_PROTO.get(role.lower())
     if proto_role is None:
         raise ValidationError(f"Invalid content role: {role}")
         
@@ -107,12 +136,7 @@ def from_proto_content(content: sdk_pb2.Content) -> typing.Dict[str, typing.Any]
     Raises:
         ValidationError: If content is invalid
     """
-    role_map = {
-        sdk_pb2.Content.ROLE_SYSTEM: "system",
-        sdk_pb2.Content.ROLE_USER: "user",
-        sdk_pb2.Content.ROLE_AI: "ai",
-    }
-    role = role_map.get(content.role)
+    role = _PROTO_TO_ROLE.get(content.role)
     if role is None:
         raise ValidationError(f"Invalid content role enum: {content.role}")
         
@@ -124,6 +148,37 @@ def from_proto_content(content: sdk_pb2.Content) -> typing.Dict[str, typing.Any]
         result["data"] = content.data
     return result
 
+def from_proto_contents(
+    contents: typing.Iterable[sdk_pb2.Content]
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    Convert a sequence of proto Content messages to Python dictionaries.
+    
+    Equivalent to calling from_proto_content on each message, with the
+    lookups bound once for the whole batch (e.g. a conversation history).
+    
+    Args:
+        contents: Proto Content messages
+        
+    Returns:
+        List of dictionaries with role, content, and optional data
+        
+    Raises:
+        ValidationError: If any content has an invalid role
+    """
+    role_get = _PROTO_TO_ROLE.get
+    results: typing.List[typing.Dict[str, typing.Any]] = []
+    append = results.append
+    for content in contents:
+        role = role_get(content.role)
+        if role is None:
+            raise ValidationError(f"Invalid content role enum: {content.role}")
+        item = {"role": role, "content": content.content}
+        if content.HasField("data"):
+            item["data"] = content.data
+        append(item)
+    return results
+
 def to_proto_request(tool: ToolMetadata) -> sdk_pb2.ToolRequest:
     """
     Convert Python tool metadata to a proto ToolRequest message.
@@ -193,9 +248,13 @@ def to_proto_app_metadata(app: AppMetadata) -> sdk_pb2.AppMetadata:
     if not app.description:
         raise ValidationError("App description cannot be empty")
         
-    return sdk_pb2.AppMetadata(
-        **dataclass_asdict(app)
-    )
+    message = sdk_pb2.AppMetadata()
+    message.fullname = app.fullname
+    message.description = app.description
+    message.name = app.name
+    message.goal = app.goal
+    message.icon_url = app.icon_url
+    return message
 
 def from_proto_app_metadata(metadata: sdk_pb2.AppMetadata) -> AppMetadata:
     """
@@ -223,12 +282,125 @@ def from_proto_app_metadata(metadata: sdk_pb2.AppMetadata) -> AppMetadata:
         icon_url=metadata.icon_url,
     )
 
-def message_to_dict(message) -> dict:
+# Field types that JSON encodes differently from their Python value
+_INT64_TYPES = frozenset({
+    FieldDescriptor.TYPE_INT64,
+    FieldDescriptor.TYPE_UINT64,
+    FieldDescriptor.TYPE_SINT64,
+    FieldDescriptor.TYPE_FIXED64,
+    FieldDescriptor.TYPE_SFIXED64,
+})
+_FLOAT_TYPES = frozenset({
+    FieldDescriptor.TYPE_FLOAT,
+    FieldDescriptor.TYPE_DOUBLE,
+})
+
+_INF = float("inf")
+
+# Field kinds used by the message_to_dict walker
+_KIND_SCALAR = 0
+_KIND_REPEATED = 1
+_KIND_MAP = 2
+
+def _is_repeated(field: FieldDescriptor) -> bool:
+    """Check whether a field is repeated; newer protobuf drops field.label."""
+    is_repeated = getattr(field, "is_repeated", None)
+    if is_repeated is not None:
+        return is_repeated
+    return field.label == FieldDescriptor.LABEL_REPEATED
+
+# Per-descriptor field plans, keyed by message full name
+_FIELD_PLANS: typing.Dict[str, typing.Tuple[typing.Tuple[FieldDescriptor, int], ...]] = {}
+
+def _field_plan(descriptor) -> typing.Tuple[typing.Tuple[FieldDescriptor, int], ...]:
+    """Get the cached (field, kind) list for a message descriptor."""
+    plan = _FIELD_PLANS.get(descriptor.full_name)
+    if plan is None:
+        entries = []
+        for field in descriptor.fields:
+            if not _is_repeated(field):
+                kind = _KIND_SCALAR
+            elif (
+                field.type == FieldDescriptor.TYPE_MESSAGE and
+                field.message_type.GetOptions().map_entry
+            ):
+                kind = _KIND_MAP
+            else:
+                kind = _KIND_REPEATED
+            entries.append((field, kind))
+        plan = _FIELD_PLANS[descriptor.full_name] = tuple(entries)
+    return plan
+
+def _value_to_json(
+    field: FieldDescriptor,
+    value: typing.Any,
+    include_defaults: bool
+) -> typing.Any:
+    """Convert a single field value the way json_format.MessageToDict does."""
+    field_type = field.type
+    if field_type == FieldDescriptor.TYPE_MESSAGE:
+        return _message_to_dict(value, include_defaults)
+    if field_type == FieldDescriptor.TYPE_ENUM:
+        enum_value = field.enum_type.values_by_number.get(value)
+        return enum_value.name if enum_value is not None else value
+    if field_type == FieldDescriptor.TYPE_BYTES:
+        return base64.b64encode(value).decode("utf-8")
+    if field_type in _INT64_TYPES:
+        return str(value)
+    if field_type in _FLOAT_TYPES:
+        if value != value:
+            return "NaN"
+        if value in (_INF, -_INF):
+            return "Infinity" if value > 0 else "-Infinity"
+        if field_type == FieldDescriptor.TYPE_FLOAT:
+            # float32 values widen to double; print the shortest float32 repr
+            return type_checkers.ToShortestFloat(value)
+    return value
+
+def _message_to_dict(message, include_defaults: bool) -> dict:
+    """Walk a message's fields and build its JSON-compatible dictionary."""
+    descriptor = message.DESCRIPTOR
+    if descriptor.full_name.startswith("google.protobuf."):
+        # Well-known types have special JSON mappings
+        return json_format.MessageToDict(message, preserving_proto_field_name=True)
+
+    result = {}
+    for field, kind in _field_plan(descriptor):
+        if field.has_presence:
+            if not message.HasField(field.name):
+                continue
+            value = getattr(message, field.name)
+        else:
+            value = getattr(message, field.name)
+            if not (value or include_defaults):
+                continue
+        if kind == _KIND_SCALAR:
+            result[field.name] = _value_to_json(field, value, include_defaults)
+        elif kind == _KIND_REPEATED:
+            result[field.name] = [
+                _value_to_json(field, v, include_defaults) for v in value
+            ]
+        else:
+            value_field = field.message_type.fields_by_name["value"]
+            result[field.name] = {
+                str(k).lower() if isinstance(k, bool) else str(k):
+                    _value_to_json(value_field, v, include_defaults)
+                for k, v in value.items()
+            }
+    return result
+
+def message_to_dict(message, include_defaults: bool = False) -> dict:
     """
     Convert a protobuf message to a Python dictionary.
     
+    Mirrors json_format.MessageToDict with proto field names, using a cached
+    per-descriptor field walk instead of the generic JSON printer. Intended
+    for JSON consumers.
+    
     Args:
         message: Proto message to convert
+        include_defaults: Also emit fields without presence that hold their
+            default value (the old behaviour, for legacy consumers)
         
     Returns:
         Dictionary representation
@@ -237,11 +409,7 @@ def message_to_dict(message) -> dict:
         ValidationError: If conversion fails
     """
     try:
-    return json_format.MessageToDict(
-        message,
-        preserving_proto_field_name=True,
-        including_default_value_fields=True,
-    )
+        return _message_to_dict(message, include_defaults)
     except Exception as e:
         raise ValidationError(f"Failed to convert message to dict: {str(e)}")
 
@@ -260,6 +428,6 @@ def dict_to_message(data: dict, message_type) -> typing.Any:
         ValidationError: If conversion fails
     """
     try:
-    return json_format.ParseDict(data, message_type()) 
+        return json_format.ParseDict(data, message_type())
     except Exception as e:
-        raise ValidationError(f"Failed to convert dict to message: {str(e)}") 
\ No newline at end of file
+        raise ValidationError(f"Failed to convert dict to message: {str(e)}")
@@ -13,6 +13,10 @@ from ...types.models import TruffleReturnType, ToolMetadata, AppMetadata
 from .. import sdk_pb2
 from ...client.exceptions import ValidationError
 
+# Required non-empty fields, checked in order
+_TOOL_REQUIRED = ("name", "description")
+_APP_REQUIRED = ("fullname", "name", "description", "goal")
+
 def validate_truffle_type(obj: typing.Any) -> None:
     """Validate that an object is a valid Truffle type."""
     if not isinstance(obj, TruffleReturnType):
@@ -49,10 +53,9 @@ def validate_proto_content(content: sdk_pb2.Content) -> None:
 
 def validate_tool_metadata(tool: ToolMetadata) -> None:
     """Validate that tool metadata is valid."""
-    if not tool.name:
-        raise ValidationError("Tool name cannot be empty")
-    if not tool.description:
-        raise ValidationError("Tool description cannot be empty")
+    for field in _TOOL_REQUIRED:
+        if not getattr(tool, field):
+            raise ValidationError(f"Tool {field} cannot be empty")
 
 def validate_tool_request(request: sdk_pb2.ToolRequest) -> None:
     """Validate that a proto ToolRequest message is valid."""
@@ -68,14 +71,9 @@ def validate_tool_response(response: sdk_pb2.ToolResponse) -> None:
 
 def validate_app_metadata(metadata: AppMetadata) -> None:
     """Validate that app metadata is valid."""
-    if not metadata.fullname:
-        raise ValidationError("App fullname cannot be empty")
-    if not metadata.name:
-        raise ValidationError("App name cannot be empty")
-    if not metadata.description:
-        raise ValidationError("App description cannot be empty")
-    if not metadata.goal:
-        raise ValidationError("App goal cannot be empty")
+    for field in _APP_REQUIRED:
+        if not getattr(metadata, field):
+            raise ValidationError(f"App {field} cannot be empty")
 
 def validate_generate_request(request: sdk_pb2.GenerateRequest) -> None:
     """Validate that a GenerateRequest message is valid."""
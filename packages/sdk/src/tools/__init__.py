@@ -8,6 +8,11 @@ Features:
 - Argument specification and validation
 - Tool registry and discovery
 - Type-safe interfaces
+
+Tool arguments and results are converted through protobuf, so install the
+protobuf wheel with its compiled backend (upb/cpp). The SDK warns when
+only the pure-Python backend is available; set
+TRUFFLE_REQUIRE_CPP_PROTOBUF=1 to turn that into an error.
 """
 
 from .decorators import tool, args, ToolConfig
@@ -10,12 +10,11 @@ Core Features:
 - Function metadata handling
 """
 
-import functools
 import inspect
 import typing
 from dataclasses import dataclass
 
-from ..types.models import TruffleReturnType, ToolMetadata
+from ..types.models import ToolMetadata, _ALLOWED_RETURN_TYPES
 from ..client.exceptions import ValidationError
 
 @dataclass
@@ -50,7 +49,8 @@ def tool(
         icon: Optional icon URL or emoji for the tool
         
     Returns:
-        Decorated function
+        Decorator that attaches the tool configuration to the function
+        and returns it unchanged
         
     Raises:
         ValidationError: If function signature is invalid
@@ -68,27 +68,34 @@ def tool(
         return_type = sig.return_annotation
         if return_type is inspect.Signature.empty:
             raise ValidationError(f"Tool {tool_name} must have a return type annotation")
-        if not (
-            isinstance(return_type, type) and 
-            issubclass(return_type, TruffleReturnType)
-        ):
+        try:
+            allowed = return_type in _ALLOWED_RETURN_TYPES
+        except TypeError:  # unhashable annotation
+            allowed = False
+        if not allowed:
             raise ValidationError(
                 f"Tool {tool_name} must return a TruffleReturnType, got {return_type}"
             )
 
-        # Store tool configuration
-        func.__truffle_tool__ = ToolConfig(
+        # Store tool configuration (and the signature, reused by @args)
+        func.__truffle_sig__ = sig
+        config = func.__truffle_tool__ = ToolConfig(
             name=tool_name,
             description=tool_desc,
             icon=icon,
             args={},
         )
         
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
+        # Prebuilt registry metadata; shares the args dict so @args
+        # descriptions added later are reflected
+        func.__truffle_metadata__ = ToolMetadata(
+            name=config.name,
+            description=config.description,
+            icon=config.icon,
+            args=config.args,
+        )
         
-        return wrapper
+        return func
     return decorator
 
 def args(**arg_descriptions: str) -> typing.Callable:
@@ -111,8 +118,8 @@ def args(**arg_descriptions: str) -> typing.Callable:
                 f"@args can only be used on functions decorated with @tool"
             )
         
-        # Get function signature
-        sig = inspect.signature(func)
+        # Get function signature (cached by @tool)
+        sig = getattr(func, "__truffle_sig__", None) or inspect.signature(func)
         
         # Validate all described args exist
         for arg_name in arg_descriptions:
@@ -124,9 +131,5 @@ def args(**arg_descriptions: str) -> typing.Callable:
         # Store argument descriptions
         func.__truffle_tool__.args.update(arg_descriptions)
         
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        
-        return wrapper
+        return func
     return decorator
@@ -11,6 +11,7 @@ Features:
 """
 
 import inspect
+import sys
 import typing
 from pathlib import Path
 import importlib.util
@@ -24,8 +25,9 @@ class ToolRegistry:
     
     def __init__(self):
         """Initialize an empty tool registry."""
-        self._tools: typing.Dict[str, typing.Callable] = {}
-        self._metadata: typing.Dict[str, ToolMetadata] = {}
+        self._entries: typing.Dict[
+            str, typing.Tuple[typing.Callable, ToolMetadata]
+        ] = {}
 
     def register(
         self,
@@ -52,23 +54,26 @@ class ToolRegistry:
         # Get tool configuration
         config: ToolConfig = func.__truffle_tool__
         
-        # Create tool metadata
-        tool_name = name or config.name
-        tool_desc = description or config.description
-        tool_icon = icon or config.icon
+        # Reuse the metadata built by @tool unless something is overridden
+        metadata: typing.Optional[ToolMetadata] = None
+        if not (name or description or icon):
+            metadata = getattr(func, "__truffle_metadata__", None)
+        if metadata is None:
+            metadata = ToolMetadata(
+                name=name or config.name,
+                description=description or config.description,
+                icon=icon or config.icon,
+                args=config.args,
+            )
+        # Interned so dispatch lookups usually match by identity
+        tool_name = sys.intern(metadata.name)
         
         # Validate name uniqueness
-        if tool_name in self._tools:
+        if tool_name in self._entries:
             raise ValidationError(f"Tool {tool_name} is already registered")
         
         # Store tool and metadata
-        self._tools[tool_name] = func
-        self._metadata[tool_name] = ToolMetadata(
-            name=tool_name,
-            description=tool_desc,
-            icon=tool_icon,
-            args=config.args,
-        )
+        self._entries[tool_name] = (func, metadata)
 
     def get_tool(self, name: str) -> typing.Tuple[typing.Callable, ToolMetadata]:
         """
@@ -80,13 +85,14 @@ class ToolRegistry:
         Returns:
             Tuple of (tool_function, tool_metadata)
         """
-        if name not in self._tools:
+        entry = self._entries.get(name)
+        if entry is None:
             raise ValidationError(f"Tool {name} not found")
-        return self._tools[name], self._metadata[name]
+        return entry
 
     def list_tools(self) -> typing.List[ToolMetadata]:
         """Get metadata for all registered tools."""
-        return list(self._metadata.values())
+        return [metadata for _, metadata in self._entries.values()]
 
     def discover_tools(self, directory: typing.Union[str, Path]) -> None:
         """
@@ -10,20 +10,33 @@ Features:
 - String processing and sanitization
 """
 
+import functools
 import inspect
+import itertools
 import typing
 import warnings
 import os
+import stat
+import sys
 from pathlib import Path
 from typing import (
-    Any, Dict, Optional, Tuple, Type, Union,
+    Any, Dict, NamedTuple, Optional, Tuple, Type, Union,
     get_type_hints, get_origin, get_args
 )
 
 from ..platform import sdk_pb2
 
 # Type definitions
-ArgSpec = Dict[str, Any]
+class ArgSpec(NamedTuple):
+    """Specification of a single tool argument."""
+    name: str
+    type: Any
+    default: Any
+    optional: bool
+    kind: str
+    description: str
+    annotations: Dict[str, Any]
+
 TypeSpec = Union[Type, str]
 MetadataDict = Dict[str, Any]
 
@@ -39,6 +52,25 @@ TRUFFLE_TYPES = {
     'null': type(None)
 }
 
+# Parameter kind -> display string, e.g. 'POSITIONAL_OR_KEYWORD'
+_KIND_STR = {kind: str(kind) for kind in type(inspect.Parameter.POSITIONAL_ONLY)}
+
+# Tool errors re-raised as their own type (others become RuntimeError)
+_RERAISE_TYPES = (ValueError, TypeError)
+
+# Newline removal for sanitize_string: '\n' -> ' ', '\r' dropped
+_NO_NL_TABLE = str.maketrans({'\n': ' ', '\r': None})
+
+@functools.lru_cache(maxsize=4096)
+def _cached_origin(type_hint: Any) -> Any:
+    """Memoized typing.get_origin, falling back to the hint itself."""
+    return get_origin(type_hint) or type_hint
+
+@functools.lru_cache(maxsize=4096)
+def _cached_args(type_hint: Any) -> Tuple[Any, ...]:
+    """Memoized typing.get_args."""
+    return get_args(type_hint)
+
 def get_type_origin(type_hint: Any) -> Optional[Any]:
     """
     Get the origin of a type hint safely.
@@ -49,6 +81,13 @@ def get_type_origin(type_hint: Any) -> Optional[Any]:
     Returns:
         Type origin or None
     """
+    try:
+        return _cached_origin(type_hint)
+    except TypeError:
+        # Unhashable hint; inspect it directly
+        pass
+    except Exception:
+        return None
     try:
         return get_origin(type_hint) or type_hint
     except Exception:
@@ -64,11 +103,46 @@ def get_type_args(type_hint: Any) -> Tuple[Any, ...]:
     Returns:
         Tuple of type arguments
     """
+    try:
+        return _cached_args(type_hint)
+    except TypeError:
+        # Unhashable hint; inspect it directly
+        pass
+    except Exception:
+        return ()
     try:
         return get_args(type_hint)
     except Exception:
         return ()
 
+@functools.lru_cache(maxsize=1024)
+def _resolve_str_type(type_str: str) -> Any:
+    """Resolve a string type spec such as "typing.List[str]" once per string."""
+    return eval(type_str, globals(), {'typing': typing})
+
+def _plain_class(type_hint: TypeSpec) -> Optional[type]:
+    """Return the class isinstance can check directly, or None for typing constructs."""
+    if isinstance(type_hint, str):
+        type_hint = TRUFFLE_TYPES.get(type_hint)
+    if type_hint is Any or not inspect.isclass(type_hint):
+        return None
+    return type_hint if get_type_origin(type_hint) is type_hint else None
+
+@functools.lru_cache(maxsize=1024)
+def _union_classes(members: Tuple[Any, ...]) -> Optional[Tuple[type, ...]]:
+    """Get a Union's members as an isinstance tuple if they are all plain classes."""
+    classes = tuple(map(_plain_class, members))
+    return None if None in classes else classes
+
+def _all_valid(values: typing.Iterable[Any], elem_type: TypeSpec) -> bool:
+    """Check every element, running isinstance from C when elem_type is a plain class."""
+    if elem_type is Any or elem_type == 'Any':
+        return True
+    cls = _plain_class(elem_type)
+    if cls is not None:
+        return all(map(isinstance, values, itertools.repeat(cls)))
+    return all(validate_return_type(x, elem_type) for x in values)
+
 def validate_return_type(value: Any, expected_type: TypeSpec) -> bool:
     """
     Validate a return value against its expected type.
@@ -82,7 +156,7 @@ def validate_return_type(value: Any, expected_type: TypeSpec) -> bool:
     """
     try:
         # Handle Any type
-        if expected_type == 'Any' or expected_type == Any:
+        if expected_type is Any or expected_type == 'Any':
             return True
             
         # Convert string type specs
@@ -92,7 +166,7 @@ def validate_return_type(value: Any, expected_type: TypeSpec) -> bool:
             else:
                 # Handle complex string types (e.g. "List[str]")
                 try:
-                    expected_type = eval(expected_type, globals(), {'typing': typing})
+                    expected_type = _resolve_str_type(expected_type)
                 except Exception:
                     return False
         
@@ -106,6 +180,9 @@ def validate_return_type(value: Any, expected_type: TypeSpec) -> bool:
             
         # Handle Union types (including Optional)
         if origin is Union:
+            classes = _union_classes(args)
+            if classes is not None:
+                return isinstance(value, classes)
             return any(
                 validate_return_type(value, arg)
                 for arg in args
@@ -115,16 +192,15 @@ def validate_return_type(value: Any, expected_type: TypeSpec) -> bool:
         if origin is list:
             if not isinstance(value, list):
                 return False
-            elem_type = args[0] if args else Any
-            return all(validate_return_type(x, elem_type) for x in value)
+            return _all_valid(value, args[0] if args else Any)
             
         if origin is dict:
             if not isinstance(value, dict):
                 return False
             key_type, val_type = args if len(args) == 2 else (Any, Any)
-            return all(
-                validate_return_type(k, key_type) and validate_return_type(v, val_type)
-                for k, v in value.items()
+            return (
+                _all_valid(value.keys(), key_type) and
+                _all_valid(value.values(), val_type)
             )
             
         if origin is tuple:
@@ -133,16 +209,14 @@ def validate_return_type(value: Any, expected_type: TypeSpec) -> bool:
             if not args or args == ((),):
                 return True
             if len(args) == 2 and args[1] is ...:
-                elem_type = args[0]
-                return all(validate_return_type(x, elem_type) for x in value)
+                return _all_valid(value, args[0])
             return (len(value) == len(args) and
                     all(validate_return_type(v, t) for v, t in zip(value, args)))
             
         if origin is set:
             if not isinstance(value, set):
                 return False
-            elem_type = args[0] if args else Any
-            return all(validate_return_type(x, elem_type) for x in value)
+            return _all_valid(value, args[0] if args else Any)
             
         # Handle basic types
         if origin in TRUFFLE_TYPES.values():
@@ -162,16 +236,39 @@ def validate_return_type(value: Any, expected_type: TypeSpec) -> bool:
         warnings.warn(f"Type validation error: {e}")
         return False
 
-def extract_metadata(func: typing.Callable) -> MetadataDict:
+# get_type_hints wraps hints of None-defaulted parameters in Optional before 3.11
+_IMPLICIT_OPTIONAL = sys.version_info < (3, 11)
+
+def _is_resolved_hint(hint: Any) -> bool:
+    """Check that get_type_hints would return a hint unchanged."""
+    if hint is None or isinstance(hint, (str, typing.ForwardRef)):
+        return False
+    if hasattr(hint, '__metadata__'):  # Annotated, stripped by get_type_hints
+        return False
+    return all(_is_resolved_hint(arg) for arg in get_type_args(hint) if arg is not ...)
+
+def _get_hints(func: typing.Callable) -> Dict[str, Any]:
     """
-    Extract metadata from a tool function.
-    
-    Args:
-        func: The function to extract metadata from
-        
-    Returns:
-        Dictionary of metadata
+    Get a function's type hints, reading __annotations__ directly when
+    get_type_hints would have nothing to resolve.
     """
+    annotations = getattr(func, '__annotations__', None)
+    if (
+        (inspect.isfunction(func) or inspect.ismethod(func)) and
+        isinstance(annotations, dict) and
+        not (
+            _IMPLICIT_OPTIONAL and (
+                None in (func.__defaults__ or ()) or
+                None in (func.__kwdefaults__ or {}).values()
+            )
+        ) and
+        all(_is_resolved_hint(hint) for hint in annotations.values())
+    ):
+        return dict(annotations)
+    return get_type_hints(func)
+
+def _build_metadata(func: typing.Callable) -> MetadataDict:
+    """Inspect a function and build its metadata dictionary."""
     # Get basic metadata
     metadata: MetadataDict = {
         'name': func.__name__,
@@ -185,7 +282,7 @@ def extract_metadata(func: typing.Callable) -> MetadataDict:
     
     # Get type hints
     try:
-        hints = get_type_hints(func)
+        hints = _get_hints(func)
     except Exception:
         hints = {}
     
@@ -200,16 +297,15 @@ def extract_metadata(func: typing.Callable) -> MetadataDict:
         if name == 'self':
             continue
             
-        arg_spec: ArgSpec = {
-            'name': name,
-            'type': hints.get(name, Any),
-            'default': ... if param.default is param.empty else param.default,
-            'optional': param.default is not param.empty,
-            'kind': str(param.kind),
-            'description': '',
-            'annotations': getattr(param, '__annotations__', {})
-        }
-        metadata['args'][name] = arg_spec
+        metadata['args'][name] = ArgSpec(
+            name=name,
+            type=hints.get(name, Any),
+            default=... if param.default is param.empty else param.default,
+            optional=param.default is not param.empty,
+            kind=_KIND_STR[param.kind],
+            description='',
+            annotations=getattr(param, '__annotations__', {}),
+        )
         
     # Get return type
     metadata['return_type'] = hints.get('return', Any)
@@ -220,6 +316,177 @@ def extract_metadata(func: typing.Callable) -> MetadataDict:
         
     return metadata
 
+@functools.lru_cache(maxsize=None)
+def _cached_metadata(func: typing.Callable) -> MetadataDict:
+    """
+    Build metadata once per function; the result must not be mutated.
+    
+    Argument specs are ArgSpec tuples here; extract_metadata converts them
+    to dictionaries.
+    """
+    return _build_metadata(func)
+
+def _get_metadata(func: typing.Callable) -> MetadataDict:
+    """Get shared (read-only) metadata, caching it when func is hashable."""
+    try:
+        hash(func)
+    except TypeError:
+        return _build_metadata(func)
+    return _cached_metadata(func)
+
+def extract_metadata(func: typing.Callable) -> MetadataDict:
+    """
+    Extract metadata from a tool function.
+    
+    Signature and type hint inspection runs once per function; each call
+    returns a fresh copy that the caller may modify.
+    
+    Args:
+        func: The function to extract metadata from
+        
+    Returns:
+        Dictionary of metadata, with one dictionary per argument under 'args'
+    """
+    metadata = _get_metadata(func)
+    return {
+        **metadata,
+        'args': {name: spec._asdict() for name, spec in metadata['args'].items()},
+        'decorators': list(metadata['decorators']),
+    }
+
+# Compiled argument validator: (required names, per-argument checks); the
+# check is None for arguments that accept any value
+Validator = Tuple[
+    typing.FrozenSet[str], Dict[str, Optional[typing.Callable[[Any], bool]]]
+]
+
+# Marks an argument name missing from a validator's checks
+_UNKNOWN_ARG = object()
+
+def _bind(obj: Any, ns: Dict[str, Any]) -> str:
+    """Add an object to a validator namespace and return its name."""
+    name = f'_t{len(ns)}'
+    ns[name] = obj
+    return name
+
+def _compile_check(hint: TypeSpec, var: str, ns: Dict[str, Any], depth: int = 0) -> str:
+    """
+    Emit a Python expression checking `var` against a type hint.
+    
+    Mirrors validate_return_type; hints it cannot inline are delegated to
+    it at runtime.
+    
+    Args:
+        hint: Type hint to compile
+        var: Expression naming the value to check
+        ns: Namespace the expression will be evaluated in
+        depth: Nesting level, used to name loop variables
+        
+    Returns:
+        Python expression source
+    """
+    if hint is Any or hint == 'Any':
+        return 'True'
+    if isinstance(hint, str):
+        if hint not in TRUFFLE_TYPES:
+            return f'_validate({var}, {_bind(hint, ns)})'
+        hint = TRUFFLE_TYPES[hint]
+        
+    origin = get_type_origin(hint)
+    args = get_type_args(hint)
+    
+    if origin is type(None):
+        return f'{var} is None'
+        
+    if origin is Union:
+        classes = _union_classes(args)
+        if classes is not None:
+            return f'isinstance({var}, {_bind(classes, ns)})'
+        return '(' + ' or '.join(
+            _compile_check(arg, var, ns, depth) for arg in args
+        ) + ')'
+        
+    if origin is list or origin is set:
+        elems = _compile_all(args[0] if args else Any, var, ns, depth)
+        return f'(isinstance({var}, {origin.__name__}) and {elems})'
+        
+    if origin is dict:
+        key_type, val_type = args if len(args) == 2 else (Any, Any)
+        return (
+            f'(isinstance({var}, dict) and '
+            f'{_compile_all(key_type, f"{var}.keys()", ns, depth)} and '
+            f'{_compile_all(val_type, f"{var}.values()", ns, depth)})'
+        )
+        
+    if origin is tuple:
+        if not args or args == ((),):
+            return f'isinstance({var}, tuple)'
+        if len(args) == 2 and args[1] is ...:
+            return f'(isinstance({var}, tuple) and {_compile_all(args[0], var, ns, depth)})'
+        return '(' + ' and '.join(
+            [f'isinstance({var}, tuple)', f'len({var}) == {len(args)}'] +
+            [_compile_check(t, f'{var}[{i}]', ns, depth) for i, t in enumerate(args)]
+        ) + ')'
+        
+    if inspect.isclass(origin) or hasattr(origin, 'DESCRIPTOR'):
+        return f'isinstance({var}, {_bind(origin, ns)})'
+        
+    return f'_validate({var}, {_bind(hint, ns)})'
+
+def _compile_all(elem_type: TypeSpec, var: str, ns: Dict[str, Any], depth: int) -> str:
+    """Emit an expression checking every element of the iterable `var`."""
+    if elem_type is Any or elem_type == 'Any':
+        return 'True'
+    cls = _plain_class(elem_type)
+    if cls is not None:
+        return f'all(map(isinstance, {var}, _repeat({_bind(cls, ns)})))'
+    item = f'_x{depth}'
+    return f'all({_compile_check(elem_type, item, ns, depth + 1)} for {item} in {var})'
+
+def build_validator(func: typing.Callable) -> Validator:
+    """
+    Compile argument type checks for a tool function.
+    
+    Each argument's type hint is turned into a single Python expression
+    once, so validation avoids re-walking the hint on every call.
+    
+    Args:
+        func: The tool function
+        
+    Returns:
+        Tuple of (required argument names, argument name -> check function,
+        or None if the argument accepts any value)
+    """
+    metadata = _get_metadata(func)
+    ns: Dict[str, Any] = {'_validate': validate_return_type, '_repeat': itertools.repeat}
+    source = []
+    for i, spec in enumerate(metadata['args'].values()):
+        expr = _compile_check(spec.type, 'v', ns)
+        if expr != 'True':
+            source.append(f"def _check{i}(v):\n    return {expr}\n")
+    exec(compile(''.join(source), f"<validator {metadata['qualname']}>", 'exec'), ns)
+    
+    required = frozenset(
+        name for name, spec in metadata['args'].items() if not spec.optional
+    )
+    checks = {
+        name: ns.get(f'_check{i}') for i, name in enumerate(metadata['args'])
+    }
+    return required, checks
+
+@functools.lru_cache(maxsize=None)
+def _cached_validator(func: typing.Callable) -> Validator:
+    """Compile a function's validator once."""
+    return build_validator(func)
+
+def _get_validator(func: typing.Callable) -> Validator:
+    """Get a function's validator, caching it when func is hashable."""
+    try:
+        hash(func)
+    except TypeError:
+        return build_validator(func)
+    return _cached_validator(func)
+
 def validate_tool_args(
     func: typing.Callable,
     args: Dict[str, Any],
@@ -238,7 +505,22 @@ def validate_tool_args(
         TypeError: If type validation fails
     """
     if metadata is None:
-        metadata = extract_metadata(func)
+        required, checks = _get_validator(func)
+        if not required <= args.keys():
+            missing = required - args.keys()
+            name = next(name for name in checks if name in missing)
+            raise ValueError(f"Missing required argument: {name}")
+        for name, value in args.items():
+            check = checks.get(name, _UNKNOWN_ARG)
+            if check is _UNKNOWN_ARG:
+                raise ValueError(f"Unknown argument: {name}")
+            if check is not None and not check(value):
+                expected_type = _get_metadata(func)['args'][name].type
+                raise TypeError(
+                    f"Invalid type for argument {name}: "
+                    f"expected {expected_type}, got {type(value)}"
+                )
+        return
         
     # Check required args
     for name, spec in metadata['args'].items():
@@ -268,15 +550,13 @@ def format_error(error: Exception, tool_name: str) -> sdk_pb2.SDKResponse:
     Returns:
         Formatted SDK response
     """
-    error_msg = str(error)
-    if isinstance(error, (ValueError, TypeError)):
-        error_type = error.__class__.__name__
-        error_msg = f"{error_type}: {error_msg}"
+    error_type = type(error).__name__
+    if isinstance(error, _RERAISE_TYPES):
+        message = f"Tool '{tool_name}' error: {error_type}: {error}"
+    else:
+        message = f"Tool '{tool_name}' error: {error}"
         
-    return sdk_pb2.SDKResponse(
-        error=f"Tool '{tool_name}' error: {error_msg}",
-        error_type=type(error).__name__
-    )
+    return sdk_pb2.SDKResponse(error=message, error_type=error_type)
 
 def convert_path(path: Union[str, Path]) -> Path:
     """
@@ -292,9 +572,7 @@ def convert_path(path: Union[str, Path]) -> Path:
         ValueError: If path is invalid
     """
     try:
-        if isinstance(path, Path):
-            return path.resolve()
-        return Path(str(path)).resolve()
+        return Path(os.path.realpath(os.fspath(path)))
     except Exception as e:
         raise ValueError(f"Invalid path: {e}")
 
@@ -322,13 +600,19 @@ def validate_path(
         PermissionError: If permission check fails
     """
     try:
-        if must_exist and not path.exists():
+        # One stat call answers exists/is_file/is_dir
+        try:
+            mode = os.stat(path).st_mode
+        except OSError:
+            mode = None
+            
+        if must_exist and mode is None:
             raise ValueError(f"Path does not exist: {path}")
             
-        if path.exists():
-            if not file_okay and path.is_file():
+        if mode is not None:
+            if not file_okay and stat.S_ISREG(mode):
                 raise ValueError(f"Path must not be a file: {path}")
-            if not dir_okay and path.is_dir():
+            if not dir_okay and stat.S_ISDIR(mode):
                 raise ValueError(f"Path must not be a directory: {path}")
                 
             # Check permissions
@@ -367,7 +651,7 @@ def sanitize_string(
         s = s.strip()
         
     if not allow_newlines:
-        s = s.replace('\n', ' ').replace('\r', '')
+        s = s.translate(_NO_NL_TABLE)
         
     if len(s) > max_length:
         s = s[:max_length-3] + "..."
@@ -388,12 +672,14 @@ def wrap_exceptions(
     Returns:
         Wrapped function
     """
+    name = tool_name or getattr(func, '__name__', 'unknown')
+    
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            name = tool_name or getattr(func, '__name__', 'unknown')
-            if isinstance(e, (ValueError, TypeError)):
+            if isinstance(e, _RERAISE_TYPES):
                 raise type(e)(f"Tool '{name}' error: {str(e)}") from e
             raise RuntimeError(f"Tool '{name}' failed: {str(e)}") from e
     return wrapper
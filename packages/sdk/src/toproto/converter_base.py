@@ -10,6 +10,7 @@ Features:
 - Proto file generation utilities
 """
 
+import sys
 import typing
 import inspect
 from dataclasses import dataclass
@@ -24,9 +25,14 @@ from google.protobuf.descriptor import (
 from ..platform import sdk_pb2
 from ..client.exceptions import ValidationError
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; plain dataclasses before that
+_DATACLASS_OPTIONS: typing.Dict[str, typing.Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class ProtoField:
-    """Field definition for proto generation."""
+    """Field definition for proto generation; immutable so it can be shared."""
     name: str
     type: typing.Type
     label: int = FieldDescriptor.LABEL_OPTIONAL
@@ -35,7 +41,7 @@ class ProtoField:
     message_type: typing.Optional[Descriptor] = None
     enum_type: typing.Optional[Descriptor] = None
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProtoMessage:
     """Message definition for proto generation."""
     name: str
@@ -43,7 +49,7 @@ class ProtoMessage:
     nested_types: typing.List['ProtoMessage'] = None
     enum_types: typing.List[Descriptor] = None
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProtoMethod:
     """Method definition for proto generation."""
     name: str
@@ -52,7 +58,7 @@ class ProtoMethod:
     client_streaming: bool = False
     server_streaming: bool = False
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProtoService:
     """Service definition for proto generation."""
     name: str
@@ -73,22 +79,61 @@ class ConverterBase:
         self._messages: typing.Dict[str, ProtoMessage] = {}
         self._services: typing.Dict[str, ProtoService] = {}
         self._package: str = ""
+        # Built message descriptors, keyed by (id(message), package); the
+        # message is kept alongside so a reused id is never a false hit
+        self._desc_cache: typing.Dict[
+            typing.Tuple[int, str], typing.Tuple[ProtoMessage, Descriptor]
+        ] = {}
+        # Built service descriptors, keyed the same way
+        self._service_desc_cache: typing.Dict[
+            typing.Tuple[int, str], typing.Tuple[ProtoService, ServiceDescriptor]
+        ] = {}
+        # str() of built descriptors, keyed by id(descriptor)
+        self._desc_str_cache: typing.Dict[int, typing.Tuple[typing.Any, str]] = {}
 
     def set_package(self, package: str) -> None:
         """Set the proto package name."""
         self._package = package
+        self._clear_desc_caches()
 
     def add_message(self, message: ProtoMessage) -> None:
         """Add a message definition."""
         if message.name in self._messages:
             raise ValidationError(f"Message {message.name} already exists")
         self._messages[message.name] = message
+        self._clear_desc_caches()
 
     def add_service(self, service: ProtoService) -> None:
         """Add a service definition."""
         if service.name in self._services:
             raise ValidationError(f"Service {service.name} already exists")
         self._services[service.name] = service
+        self._clear_desc_caches()
+
+    def _clear_desc_caches(self) -> None:
+        """Drop built descriptors after definitions change."""
+        self._desc_cache.clear()
+        self._service_desc_cache.clear()
+        self._desc_str_cache.clear()
+
+    def _service_descriptor(self, service: ProtoService) -> ServiceDescriptor:
+        """Get the ServiceDescriptor for a service in the current package."""
+        key = (id(service), self._package)
+        cached = self._service_desc_cache.get(key)
+        if cached is not None and cached[0] is service:
+            return cached[1]
+        desc = self.create_service_descriptor(service, self._package)
+        self._service_desc_cache[key] = (service, desc)
+        return desc
+
+    def _desc_str(self, desc: typing.Any) -> str:
+        """Get str() of a built descriptor, computed once per descriptor."""
+        cached = self._desc_str_cache.get(id(desc))
+        if cached is not None and cached[0] is desc:
+            return cached[1]
+        text = str(desc)
+        self._desc_str_cache[id(desc)] = (desc, text)
+        return text
 
     def get_field_type(self, python_type: typing.Type) -> int:
         """Get the proto field type for a Python type."""
@@ -132,6 +177,11 @@ class ConverterBase:
         package: str = ""
     ) -> Descriptor:
         """Create a Descriptor from a ProtoMessage."""
+        key = (id(message), package)
+        cached = self._desc_cache.get(key)
+        if cached is not None and cached[0] is message:
+            return cached[1]
+            
         options = descriptor_pb2.MessageOptions()
         
         full_name = f"{package}.{message.name}" if package else message.name
@@ -162,6 +212,7 @@ class ConverterBase:
         if message.enum_types:
             desc.enum_types.extend(message.enum_types)
         
+        self._desc_cache[key] = (message, desc)
         return desc
 
     def create_method_descriptor(
@@ -222,11 +273,10 @@ class ConverterBase:
         # Add messages
         for message in self._messages.values():
             desc = self.create_message_descriptor(message, self._package)
-            output.append(str(desc))
+            output.append(self._desc_str(desc))
         
         # Add services
         for service in self._services.values():
-            desc = self.create_service_descriptor(service, self._package)
-            output.append(str(desc))
+            output.append(self._desc_str(self._service_descriptor(service)))
         
         return "\n".join(output) 
\ No newline at end of file
@@ -10,25 +10,93 @@ Features:
 - Option and import management
 """
 
-import textwrap
-from typing import List
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 from google.protobuf.descriptor import (
     Descriptor,
     EnumDescriptor,
     FieldDescriptor,
     FileDescriptor,
+    MethodDescriptor,
     ServiceDescriptor
 )
 
+from .utils import get_field_label
+
+_LBL_REPEATED = FieldDescriptor.LABEL_REPEATED
+_T_MESSAGE = FieldDescriptor.TYPE_MESSAGE
+_T_ENUM = FieldDescriptor.TYPE_ENUM
+
+# RPC signature templates keyed by (client_streaming, server_streaming)
+_METHOD_FMT = {
+    (False, False): "{indent}rpc {name} ({input}) returns ({output})",
+    (True, False): "{indent}rpc {name} (stream {input}) returns ({output})",
+    (False, True): "{indent}rpc {name} ({input}) returns (stream {output})",
+    (True, True): (
+        "{indent}rpc {name} (stream {input}) returns (stream {output})"
+    ),
+}
+
+class _LineWriter:
+    """List-like line sink that streams newline-separated lines to write."""
+    __slots__ = ('_write', '_sep')
+    
+    def __init__(self, write: Callable[[str], Any]):
+        self._write = write
+        self._sep = ""
+        
+    def append(self, line: str) -> None:
+        self._write(self._sep + line)
+        self._sep = "\n"
+        
+    def extend(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.append(line)
+
 class DescriptorToFile:
     """Converts protocol buffer descriptors to file content."""
     
     def __init__(self):
         """Initialize the converter."""
         self._indent = "  "
+        # Indent strings by level, extended on demand
+        self._indents = [""]
+        # "name = value" strings per options message, keyed by id(); only
+        # valid for the duration of one convert() call
+        self._option_cache: Dict[int, Tuple[Any, List[str]]] = {}
         self._current_level = 0
         
+    def _ind(self, level: int) -> str:
+        """Get the indent string for a nesting level."""
+        indents = self._indents
+        while len(indents) <= level:
+            indents.append(indents[-1] + self._indent)
+        return indents[level]
+        
+    def _option_pairs(self, options) -> List[str]:
+        """
+        Get the formatted "name = value" strings for an options message.
+        
+        Args:
+            options: Options message
+            
+        Returns:
+            Formatted option assignments, computed once per options message
+            per conversion
+        """
+        cached = self._option_cache.get(id(options))
+        # The cached entry keeps its options alive until the cache is
+        # cleared, so a matching id() is only stale if a different object
+        # is passed
+        if cached is not None and cached[0] is options:
+            return cached[1]
+        pairs = [
+            f"{option.name} = {value}"
+            for option, value in options.ListFields()
+        ]
+        self._option_cache[id(options)] = (options, pairs)
+        return pairs
+        
     def convert(self, desc: FileDescriptor) -> str:
         """
         Convert a FileDescriptor to proto file content.
@@ -39,181 +107,198 @@ class DescriptorToFile:
         Returns:
             Proto file content as string
         """
-        lines = []
+        out: List[str] = []
+        try:
+            self._format_file(desc, out)
+        finally:
+            self._option_cache.clear()
+        return "\n".join(out)
+        
+    def convert_to(self, desc: FileDescriptor, write: Callable[[str], Any]) -> None:
+        """
+        Stream proto file content for a FileDescriptor.
+        
+        Writes the same content convert() returns, line by line, without
+        building the whole file in memory.
+        
+        Args:
+            desc: FileDescriptor to convert
+            write: Callable receiving text chunks, e.g. a file's write
+        """
+        try:
+            self._format_file(desc, _LineWriter(write))
+        finally:
+            self._option_cache.clear()
+        
+    def _format_file(self, desc: FileDescriptor, out: List[str]) -> None:
+        """
+        Format a file descriptor.
         
+        Args:
+            desc: FileDescriptor to format
+            out: Output lines to append to
+        """
         # Add syntax
-        lines.append('syntax = "proto3";\n')
+        out.append('syntax = "proto3";\n')
         
         # Add package
         if desc.package:
-            lines.append(f'package {desc.package};\n')
+            out.append(f'package {desc.package};\n')
             
         # Add imports
         for dep in desc.dependencies:
-            lines.append(f'import "{dep}";\n')
+            out.append(f'import "{dep}";\n')
             
         # Add options
-        lines.extend(self._format_options(desc.options))
+        file_options = self._format_options(
+            desc.options, "option ", ";\noption ", ";"
+        )
+        if file_options:
+            out.append(file_options)
             
         # Add messages
         for message in desc.message_types_by_name.values():
-            lines.append(self._format_message(message))
+            self._format_message(message, 0, out)
             
         # Add enums
         for enum in desc.enum_types_by_name.values():
-            lines.append(self._format_enum(enum))
+            self._format_enum(enum, 0, out)
             
         # Add services
         for service in desc.services_by_name.values():
-            lines.append(self._format_service(service))
-            
-        return "\n".join(lines)
+            self._format_service(service, 0, out)
         
-    def _format_message(self, desc: Descriptor, level: int = 0) -> str:
+    def _format_message(self, desc: Descriptor, level: int, out: List[str]) -> None:
         """
         Format a message descriptor.
         
         Args:
             desc: Message descriptor
             level: Indentation level
-            
-        Returns:
-            Formatted message string
+            out: Output lines to append to
         """
-        lines = []
-        indent = self._indent * level
+        indent = self._ind(level)
         
         # Add message declaration
-        lines.append(f"{indent}message {desc.name} {{")
+        out.append(f"{indent}message {desc.name} {{")
+            
+        child = level + 1
             
         # Add nested types
         for nested in desc.nested_types:
-            lines.append(self._format_message(nested, level + 1))
+            self._format_message(nested, child, out)
             
         # Add enums
         for enum in desc.enum_types:
-            lines.append(self._format_enum(enum, level + 1))
+            self._format_enum(enum, child, out)
             
         # Add fields
+        format_field = self._format_field
         for field in desc.fields:
-            lines.append(self._format_field(field, level + 1))
+            format_field(field, child, out)
             
-        lines.append(f"{indent}}}\n")
-        return "\n".join(lines)
+        out.append(f"{indent}}}\n")
         
-    def _format_enum(self, desc: EnumDescriptor, level: int = 0) -> str:
+    def _format_enum(self, desc: EnumDescriptor, level: int, out: List[str]) -> None:
         """
         Format an enum descriptor.
         
         Args:
             desc: Enum descriptor
             level: Indentation level
-            
-        Returns:
-            Formatted enum string
+            out: Output lines to append to
         """
-        lines = []
-        indent = self._indent * level
+        indent = self._ind(level)
         
         # Add enum declaration
-        lines.append(f"{indent}enum {desc.name} {{")
+        out.append(f"{indent}enum {desc.name} {{")
         
         # Add values
-        for value in desc.values:
-            lines.append(
-                f"{indent}{self._indent}{value.name} = {value.number};"
-            )
+        value_indent = self._ind(level + 1)
+        out.extend(
+            f"{value_indent}{value.name} = {value.number};"
+            for value in desc.values
+        )
                 
-        lines.append(f"{indent}}}\n")
-        return "\n".join(lines)
+        out.append(f"{indent}}}\n")
         
-    def _format_service(self, desc: ServiceDescriptor, level: int = 0) -> str:
+    def _format_service(self, desc: ServiceDescriptor, level: int, out: List[str]) -> None:
         """
         Format a service descriptor.
         
         Args:
             desc: Service descriptor
             level: Indentation level
-            
-        Returns:
-            Formatted service string
+            out: Output lines to append to
         """
-        lines = []
-        indent = self._indent * level
+        indent = self._ind(level)
         
         # Add service declaration
-        lines.append(f"{indent}service {desc.name} {{")
+        out.append(f"{indent}service {desc.name} {{")
         
         # Add methods
         for method in desc.methods:
-            lines.append(self._format_method(method, level + 1))
+            self._format_method(method, level + 1, out)
             
-        lines.append(f"{indent}}}\n")
-        return "\n".join(lines)
+        out.append(f"{indent}}}\n")
         
-    def _format_method(self, method: ServiceDescriptor.Method, level: int) -> str:
+    def _format_method(self, method: MethodDescriptor, level: int, out: List[str]) -> None:
         """
         Format a method descriptor.
         
         Args:
             method: Method descriptor
             level: Indentation level
-            
-        Returns:
-            Formatted method string
+            out: Output lines to append to
         """
-        indent = self._indent * level
+        indent = self._ind(level)
         
         # Build method signature
-        parts = [f"{indent}rpc {method.name}"]
-        
-        # Add request
-        parts.append(
-            f"({method.input_type.name})"
-            if not method.client_streaming else
-            f"(stream {method.input_type.name})"
-        )
-        
-        # Add response
-        parts.append(
-            "returns"
-            f" ({method.output_type.name})"
-            if not method.server_streaming else
-            f" (stream {method.output_type.name})"
+        signature = _METHOD_FMT[
+            (bool(method.client_streaming), bool(method.server_streaming))
+        ].format(
+            indent=indent,
+            name=method.name,
+            input=method.input_type.name,
+            output=method.output_type.name
         )
         
         # Add options
-        if method.options.ListFields():
-            parts.append("{")
-            parts.extend(self._format_options(method.options, level + 1))
-            parts.append(f"{indent}}}")
+        option_indent = self._ind(level + 1)
+        method_options = self._format_options(
+            method.options,
+            f"{option_indent}option ",
+            f";\n{option_indent}option ",
+            ";"
+        )
+        if method_options:
+            out.append(f"{signature} {{")
+            out.append(method_options)
+            out.append(f"{indent}}}")
         else:
-            parts.append(";")
-            
-        return " ".join(parts)
+            out.append(f"{signature};")
         
-    def _format_field(self, field: FieldDescriptor, level: int) -> str:
+    def _format_field(self, field: FieldDescriptor, level: int, out: List[str]) -> None:
         """
         Format a field descriptor.
         
         Args:
             field: Field descriptor
             level: Indentation level
-            
-        Returns:
-            Formatted field string
+            out: Output lines to append to
         """
-        indent = self._indent * level
+        indent = self._ind(level)
         parts = []
         
         # Add label if needed
-        if field.label == FieldDescriptor.LABEL_REPEATED:
+        if get_field_label(field) == _LBL_REPEATED:
             parts.append("repeated")
             
         # Add type
-        if field.type == FieldDescriptor.TYPE_MESSAGE:
+        field_type = field.type
+        if field_type == _T_MESSAGE:
             parts.append(field.message_type.name)
-        elif field.type == FieldDescriptor.TYPE_ENUM:
+        elif field_type == _T_ENUM:
             parts.append(field.enum_type.name)
         else:
             parts.append(field.type_name)
@@ -222,43 +307,35 @@ class DescriptorToFile:
         parts.extend([field.name, f"= {field.number}"])
         
         # Add options
-        if field.options.ListFields():
-            parts.append("[")
-            option_parts = []
-            for option, value in field.options.ListFields():
-                option_parts.append(f"{option.name} = {value}")
-            parts.append(", ".join(option_parts))
-            parts.append("]")
+        field_options = self._format_options(field.options, "[ ", ", ", " ]")
+        if field_options:
+            parts.append(field_options)
             
-        return f"{indent}{' '.join(parts)};"
+        out.append(f"{indent}{' '.join(parts)};")
             
     def _format_options(
         self,
         options,
-        level: int = 0,
-        inline: bool = False
-    ) -> List[str]:
+        prefix: str,
+        sep: str,
+        suffix: str
+    ) -> str:
         """
-        Format options.
+        Format options as a single string.
         
         Args:
             options: Options to format
-            level: Indentation level
-            inline: Whether to format inline
+            prefix: Text before the first option
+            sep: Text between options
+            suffix: Text after the last option
             
         Returns:
-            List of formatted option strings
+            Formatted options, or an empty string if none are set
         """
         if not options:
-            return []
+            return ""
             
-        lines = []
-        indent = self._indent * level
-        
-        for option, value in options.ListFields():
-            if inline:
-                lines.append(f"{option.name} = {value}")
-            else:
-                lines.append(f"{indent}option {option.name} = {value};")
-                
-        return lines 
\ No newline at end of file
+        pairs = self._option_pairs(options)
+        if not pairs:
+            return ""
+        return f"{prefix}{sep.join(pairs)}{suffix}"
@@ -10,6 +10,8 @@ Features:
 - Nested type handling
 """
 
+import functools
+import sys
 import typing
 from dataclasses import dataclass, field
 from typing import Any, Type
@@ -19,7 +21,55 @@ from google.protobuf.descriptor import (
 )
 from google.protobuf.message import Message
 
-@dataclass
+from .converter_base import _DATACLASS_OPTIONS
+from .utils import get_field_label
+
+_LBL_REPEATED = FieldDescriptor.LABEL_REPEATED
+_LBL_REQUIRED = FieldDescriptor.LABEL_REQUIRED
+_T_MESSAGE = FieldDescriptor.TYPE_MESSAGE
+_T_ENUM = FieldDescriptor.TYPE_ENUM
+
+# Base classes for generated message and enum classes
+_BASES = (Message,)
+_ENUM_BASES = ()
+
+def _type_table(values: typing.Dict[int, Any]) -> typing.Tuple[Any, ...]:
+    """Build a tuple indexed by field type enum value."""
+    table = [None] * (FieldDescriptor.MAX_TYPE + 1)
+    for field_type, value in values.items():
+        table[field_type] = value
+    return tuple(table)
+
+# Python type per field type; None marks unsupported types
+_PY_TYPE = _type_table({
+    FieldDescriptor.TYPE_DOUBLE: float,
+    FieldDescriptor.TYPE_FLOAT: float,
+    FieldDescriptor.TYPE_INT64: int,
+    FieldDescriptor.TYPE_UINT64: int,
+    FieldDescriptor.TYPE_INT32: int,
+    FieldDescriptor.TYPE_UINT32: int,
+    FieldDescriptor.TYPE_BOOL: bool,
+    FieldDescriptor.TYPE_STRING: str,
+    FieldDescriptor.TYPE_BYTES: bytes,
+    _T_MESSAGE: Message,
+    _T_ENUM: int,
+})
+
+# Default value per field type
+_DEFAULT = _type_table({
+    FieldDescriptor.TYPE_DOUBLE: 0,
+    FieldDescriptor.TYPE_FLOAT: 0,
+    FieldDescriptor.TYPE_INT64: 0,
+    FieldDescriptor.TYPE_UINT64: 0,
+    FieldDescriptor.TYPE_INT32: 0,
+    FieldDescriptor.TYPE_UINT32: 0,
+    FieldDescriptor.TYPE_BOOL: False,
+    FieldDescriptor.TYPE_STRING: "",
+    FieldDescriptor.TYPE_BYTES: b"",
+    _T_ENUM: 0,
+})
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FieldInfo:
     """Information about a protocol buffer field."""
     name: str
@@ -31,6 +81,126 @@ class FieldInfo:
     enum_type: typing.Optional[Type] = None
     options: typing.Dict[str, Any] = field(default_factory=dict)
 
+class _FieldProperty:
+    """Data descriptor exposing a message field stored in a slot."""
+    __slots__ = ('name', 'attr', 'info', 'repeated', 'validate')
+    
+    def __init__(
+        self,
+        name: str,
+        attr: str,
+        info: FieldInfo,
+        validate: typing.Callable[[Any], Any]
+    ):
+        self.name = name
+        self.attr = attr
+        self.info = info
+        self.repeated = info.label == _LBL_REPEATED
+        self.validate = validate
+        
+    def __get__(self, msg, owner=None):
+        if msg is None:
+            return self
+        try:
+            return getattr(msg, self.attr)
+        except AttributeError:
+            # Unset slot; store the default so later reads find it
+            default = self.info.default
+            setattr(msg, self.attr, default)
+            return default
+        
+    def __set__(self, msg, value):
+        # Validate type
+        if self.repeated:
+            if not isinstance(value, (list, tuple)):
+                raise TypeError(f"Field {self.name} must be a list")
+            validate = self.validate
+            value = [validate(v) for v in value]
+        else:
+            value = self.validate(value)
+            
+        setattr(msg, self.attr, value)
+        
+    def __delete__(self, msg):
+        try:
+            delattr(msg, self.attr)
+        except AttributeError:
+            pass
+
+# Source fragments for the per-field validators built by
+# DescriptorToMessageClass._build_validator, keyed by field kind
+_VALIDATOR_NONE_CHECK = {
+    True: """\
+        if value is None:
+            raise ValueError(f"Field {_name} is required")
+""",
+    False: """\
+        if value is None:
+            return _default
+""",
+}
+
+_VALIDATOR_BODY = {
+    'message': """\
+        if isinstance(value, dict):
+            msg = _type()
+            for k, v in value.items():
+                setattr(msg, k, v)
+            return msg
+        if isinstance(value, _type):
+            return value
+        raise TypeError(f"Field {_name} must be a {_type.__name__} or dict")
+""",
+    'enum': """\
+        if isinstance(value, str):
+            if not hasattr(_type, value):
+                raise ValueError(
+                    f"Invalid enum value '{value}' for field {_name}"
+                )
+            return getattr(_type, value)
+        if not isinstance(value, int):
+            raise TypeError(f"Field {_name} must be an integer or string")
+        if value not in _values:
+            raise ValueError(f"Invalid enum value {value} for field {_name}")
+        return value
+""",
+    'scalar': """\
+        if type(value) is _type:
+            return value
+        try:
+            return _type(value)
+        except (TypeError, ValueError) as e:
+            raise TypeError(
+                f"Cannot convert value '{value}' to {_type.__name__} "
+                f"for field {_name}: {e}"
+            )
+""",
+}
+
+@functools.lru_cache(maxsize=16)
+def _validator_factory(kind: str, required: bool) -> typing.Callable:
+    """
+    Compile a validator factory for one field kind.
+    
+    Args:
+        kind: "message", "enum" or "scalar"
+        required: Whether None is rejected instead of mapped to the default
+        
+    Returns:
+        Function taking (type, name, default, enum values) and returning
+        a one-argument validator
+    """
+    source = (
+        "def _make(_type, _name, _default, _values):\n"
+        "    def validate(value):\n"
+        + _VALIDATOR_NONE_CHECK[required]
+        + _VALIDATOR_BODY[kind]
+        + "    return validate\n"
+    )
+    ns: typing.Dict[str, Any] = {}
+    exec(compile(source, f"<validator:{kind}>", "exec"), ns)
+    return ns['_make']
+
 class DescriptorToMessageClass:
     """Converts protocol buffer descriptors to Python message classes."""
     
@@ -39,10 +209,18 @@ class DescriptorToMessageClass:
         self.type_registry: typing.Dict[str, Type] = {}
         self.enum_registry: typing.Dict[str, Type] = {}
         
+    def reset(self) -> None:
+        """Forget all previously generated message and enum classes."""
+        self.type_registry.clear()
+        self.enum_registry.clear()
+        
     def convert(self, desc: Descriptor) -> Type[Message]:
         """
         Convert descriptor to message class.
         
+        Classes are generated once per descriptor full name and reused by
+        later calls; use reset() to start over.
+        
         Args:
             desc: Message descriptor to convert
             
@@ -52,10 +230,6 @@ class DescriptorToMessageClass:
         Raises:
             ValueError: If conversion fails
         """
-        # Clear registries
-        self.type_registry.clear()
-        self.enum_registry.clear()
-        
         # Process nested types first
         self._process_nested_types(desc)
         
@@ -71,13 +245,11 @@ class DescriptorToMessageClass:
         """
         # Process nested messages
         for nested in desc.nested_types:
-            message_class = self._create_message_class(nested)
-            self.type_registry[nested.full_name] = message_class
+            self._create_message_class(nested)
             
         # Process nested enums
         for enum in desc.enum_types:
-            enum_class = self._create_enum_class(enum)
-            self.enum_registry[enum.full_name] = enum_class
+            self._create_enum_class(enum)
             
     def _create_message_class(self, desc: Descriptor) -> Type[Message]:
         """
@@ -89,6 +261,10 @@ class DescriptorToMessageClass:
         Returns:
             Generated message class
         """
+        message_class = self.type_registry.get(desc.full_name)
+        if message_class is not None:
+            return message_class
+            
         fields: typing.Dict[str, FieldInfo] = {}
         
         # Process fields
@@ -97,19 +273,35 @@ class DescriptorToMessageClass:
             fields[field_info.name] = field_info
             
         # Create class attributes
+        name = sys.intern(desc.name)
         attrs = {
-            '__module__': desc.file.package,
-            '__qualname__': desc.name,
+            '__module__': sys.intern(desc.file.package),
+            '__qualname__': name,
             'DESCRIPTOR': desc,
             '_fields': fields,
         }
         
-        # Add field properties
-        for name, info in fields.items():
-            attrs[name] = self._create_field_property(name, info)
+        # Add field properties, each storing its value in a "_<name>" slot;
+        # "_f" avoids a name-mangled "__" prefix and trailing underscores
+        # are added if the name is already taken
+        slots = []
+        for field_name, info in fields.items():
+            attr = (
+                f'_f{field_name}' if field_name.startswith('_')
+                else f'_{field_name}'
+            )
+            while attr in attrs or attr in fields or attr in slots:
+                attr = f'{attr}_'
+            slots.append(attr)
+            attrs[field_name] = self._create_field_property(
+                field_name, attr, info
+            )
+        attrs['__slots__'] = tuple(slots)
             
-        # Create class
-        return type(desc.name, (Message,), attrs)
+        # Create and register class
+        message_class = type(name, _BASES, attrs)
+        self.type_registry[desc.full_name] = message_class
+        return message_class
         
     def _create_enum_class(self, desc: Descriptor) -> Type:
         """
@@ -121,22 +313,29 @@ class DescriptorToMessageClass:
         Returns:
             Generated enum class
         """
+        enum_class = self.enum_registry.get(desc.full_name)
+        if enum_class is not None:
+            return enum_class
+            
         values = {
             value.name: value.number
             for value in desc.values
         }
         
         # Create class attributes
+        name = sys.intern(desc.name)
         attrs = {
-            '__module__': desc.file.package,
-            '__qualname__': desc.name,
+            '__module__': sys.intern(desc.file.package),
+            '__qualname__': name,
             'DESCRIPTOR': desc,
             '_values_': values,
             **values
         }
         
-        # Create class
-        return type(desc.name, (), attrs)
+        # Create and register class
+        enum_class = type(name, _ENUM_BASES, attrs)
+        self.enum_registry[desc.full_name] = enum_class
+        return enum_class
         
     def _create_field_info(self, desc: FieldDescriptor) -> FieldInfo:
         """
@@ -148,74 +347,87 @@ class DescriptorToMessageClass:
         Returns:
             Field info instance
         """
+        field_type = desc.type
+        message_type = enum_type = None
+        
         # Get Python type
-        if desc.type == FieldDescriptor.TYPE_MESSAGE:
+        if field_type == _T_MESSAGE:
+            message_type = desc.message_type
             python_type = self.type_registry.get(
-                desc.message_type.full_name,
+                message_type.full_name,
                 Message
             )
-        elif desc.type == FieldDescriptor.TYPE_ENUM:
+        elif field_type == _T_ENUM:
+            enum_type = desc.enum_type
             python_type = self.enum_registry.get(
-                desc.enum_type.full_name,
+                enum_type.full_name,
                 int
             )
         else:
-            python_type = self._get_python_type(desc.type)
+            python_type = self._get_python_type(field_type)
             
         # Create field info
+        options = desc.options
         return FieldInfo(
             name=desc.name,
             number=desc.number,
             type=python_type,
-            label=desc.label,
-            default=self._get_field_default(desc.type),
-            message_type=(
-                desc.message_type if desc.type == FieldDescriptor.TYPE_MESSAGE
-                else None
-            ),
-            enum_type=(
-                desc.enum_type if desc.type == FieldDescriptor.TYPE_ENUM
-                else None
-            ),
-            options=dict(desc.options.ListFields()) if desc.options else {}
+            label=get_field_label(desc),
+            default=self._get_field_default(field_type),
+            message_type=message_type,
+            enum_type=enum_type,
+            options=dict(options.ListFields()) if options else {}
         )
         
     def _create_field_property(
         self,
         name: str,
+        attr: str,
         info: FieldInfo
-    ) -> property:
+    ) -> _FieldProperty:
         """
         Create a property for a field.
         
         Args:
             name: Field name
+            attr: Slot name holding the field value
             info: Field info
             
         Returns:
-            Property descriptor
+            Field property descriptor
+        """
+        return _FieldProperty(name, attr, info, self._build_validator(info))
+        
+    def _build_validator(self, info: FieldInfo) -> typing.Callable[[Any], Any]:
         """
-        def getter(msg):
-            if not hasattr(msg, f'_{name}'):
-                setattr(msg, f'_{name}', info.default)
-            return getattr(msg, f'_{name}')
+        Build a validator specialized for a single field.
+        
+        The generated function behaves like _validate_value for this
+        field but has the field kind, type and defaults baked in.
+        
+        Args:
+            info: Field info
             
-        def setter(msg, value):
-            # Validate type
-            if info.label == FieldDescriptor.LABEL_REPEATED:
-                if not isinstance(value, (list, tuple)):
-                    raise TypeError(f"Field {name} must be a list")
-                value = [self._validate_value(v, info) for v in value]
-            else:
-                value = self._validate_value(value, info)
-                
-            setattr(msg, f'_{name}', value)
+        Returns:
+            Function validating and converting one field value
+        """
+        if info.message_type is not None:
+            kind, values = 'message', None
+        elif info.enum_type is not None:
+            values = getattr(info.type, '_values_', None)
+            if values is None:
+                # Enum type was not generated; keep the generic path
+                validate_value = self._validate_value
+                return lambda value: validate_value(value, info)
+            kind, values = 'enum', frozenset(values.values())
+        else:
+            kind, values = 'scalar', None
             
-        def deleter(msg):
-            if hasattr(msg, f'_{name}'):
-                delattr(msg, f'_{name}')
-                
-        return property(getter, setter, deleter)
+        make = _validator_factory(
+            kind,
+            info.label == _LBL_REQUIRED
+        )
+        return make(info.type, info.name, info.default, values)
         
     def _validate_value(self, value: Any, info: FieldInfo) -> Any:
         """
@@ -233,7 +445,7 @@ class DescriptorToMessageClass:
             ValueError: If value is invalid
         """
         if value is None:
-            if info.label == FieldDescriptor.LABEL_REQUIRED:
+            if info.label == _LBL_REQUIRED:
                 raise ValueError(f"Field {info.name} is required")
             return info.default
             
@@ -288,22 +500,12 @@ class DescriptorToMessageClass:
         Raises:
             ValueError: If field type is invalid
         """
-        type_map = {
-            FieldDescriptor.TYPE_DOUBLE: float,
-            FieldDescriptor.TYPE_FLOAT: float,
-            FieldDescriptor.TYPE_INT64: int,
-            FieldDescriptor.TYPE_UINT64: int,
-            FieldDescriptor.TYPE_INT32: int,
-            FieldDescriptor.TYPE_UINT32: int,
-            FieldDescriptor.TYPE_BOOL: bool,
-            FieldDescriptor.TYPE_STRING: str,
-            FieldDescriptor.TYPE_BYTES: bytes,
-            FieldDescriptor.TYPE_MESSAGE: Message,
-            FieldDescriptor.TYPE_ENUM: int,
-        }
-        if field_type not in type_map:
+        python_type = (
+            _PY_TYPE[field_type] if 0 <= field_type < len(_PY_TYPE) else None
+        )
+        if python_type is None:
             raise ValueError(f"Unsupported field type: {field_type}")
-        return type_map[field_type]
+        return python_type
         
     def _get_field_default(self, field_type: int) -> Any:
         """
@@ -315,26 +517,6 @@ class DescriptorToMessageClass:
         Returns:
             Default value
         """
-        if field_type in {
-            FieldDescriptor.TYPE_DOUBLE,
-            FieldDescriptor.TYPE_FLOAT,
-            FieldDescriptor.TYPE_INT64,
-            FieldDescriptor.TYPE_UINT64,
-            FieldDescriptor.TYPE_INT32,
-            FieldDescriptor.TYPE_UINT32,
-        }:
-            return 0
-            
-        if field_type == FieldDescriptor.TYPE_BOOL:
-            return False
-            
-        if field_type == FieldDescriptor.TYPE_STRING:
-            return ""
-            
-        if field_type == FieldDescriptor.TYPE_BYTES:
-            return b""
-            
-        if field_type == FieldDescriptor.TYPE_ENUM:
-            return 0
-            
+        if 0 <= field_type < len(_DEFAULT):
+            return _DEFAULT[field_type]
         return None 
\ No newline at end of file
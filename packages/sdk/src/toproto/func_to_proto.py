@@ -10,12 +10,15 @@ Features:
 - Async and generator function support
 """
 
+import functools
 import typing
 import inspect
+import weakref
 from dataclasses import dataclass
 from google.protobuf.descriptor import FieldDescriptor
 
 from .converter_base import (
+    _DATACLASS_OPTIONS,
     ConverterBase,
     ProtoField,
     ProtoMessage,
@@ -24,7 +27,7 @@ from .converter_base import (
 )
 from ..client.exceptions import ValidationError
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FunctionSpec:
     """Function specification for proto generation."""
     name: str
@@ -34,6 +37,102 @@ class FunctionSpec:
     is_async: bool = False
     is_generator: bool = False
 
+_get_origin = typing.get_origin
+_get_args = typing.get_args
+_NoneType = type(None)
+_Union = typing.Union
+_LABEL_OPTIONAL = FieldDescriptor.LABEL_OPTIONAL
+_LABEL_REPEATED = FieldDescriptor.LABEL_REPEATED
+_CO_COROUTINE = inspect.CO_COROUTINE
+_CO_GENERATOR = inspect.CO_GENERATOR
+_CO_VARARGS = inspect.CO_VARARGS
+_CO_VARKEYWORDS = inspect.CO_VARKEYWORDS
+_EMPTY = inspect.Parameter.empty
+
+def _parameter_names(func: typing.Callable) -> typing.Optional[typing.List[str]]:
+    """
+    Get a function's parameter names in signature order from its code.
+    
+    Returns None when inspect.signature is needed instead: for callables
+    other than plain functions and bound methods, and for functions that
+    override their signature through __wrapped__ or __signature__.
+    """
+    bound = inspect.ismethod(func)
+    target = func.__func__ if bound else func
+    if (
+        not inspect.isfunction(target) or
+        hasattr(target, "__wrapped__") or
+        hasattr(target, "__signature__")
+    ):
+        return None
+        
+    code = target.__code__
+    names = code.co_varnames
+    positional = code.co_argcount
+    keyword_only = code.co_kwonlyargcount
+    
+    # co_varnames lists positional, keyword-only, then *args and **kwargs
+    params = list(names[:positional])
+    index = positional + keyword_only
+    if code.co_flags & _CO_VARARGS:
+        params.append(names[index])
+        index += 1
+    params.extend(names[positional:positional + keyword_only])
+    if code.co_flags & _CO_VARKEYWORDS:
+        params.append(names[index])
+        
+    # Bound methods hide their first positional parameter
+    if bound and positional:
+        del params[0]
+    return params
+
+@functools.lru_cache(maxsize=512)
+def _resolve_generic(
+    origin: typing.Any,
+    args: typing.Tuple[typing.Any, ...]
+) -> typing.Optional[typing.Tuple[typing.Type, int]]:
+    """
+    Get the proto base type and label for a generic's origin and args.
+    
+    Keyed on the args tuple rather than the annotation: Union annotations
+    compare equal regardless of member order, but the result depends on it.
+    Returns None for unsupported generics.
+    """
+    if origin is _Union and _NoneType in args:
+        # Optional type
+        return next(arg for arg in args if arg is not _NoneType), _LABEL_OPTIONAL
+    
+    if origin is list:
+        # Repeated field
+        return args[0], _LABEL_REPEATED
+    
+    if origin is dict:
+        # Map field
+        key_type, value_type = args
+        if key_type is not str:
+            raise ValidationError("Dict keys must be strings")
+        return value_type, _LABEL_REPEATED
+    
+    return None
+
+def _resolve_annotation(
+    annotation: typing.Type
+) -> typing.Tuple[typing.Type, int]:
+    """Get the proto base type and label for a type annotation."""
+    origin = _get_origin(annotation)
+    if origin is None:
+        return annotation, _LABEL_OPTIONAL
+    
+    args = _get_args(annotation)
+    try:
+        resolved = _resolve_generic(origin, args)
+    except TypeError:
+        # Unhashable args; resolve them uncached
+        resolved = _resolve_generic.__wrapped__(origin, args)
+    if resolved is None:
+        raise ValidationError(f"Unsupported type annotation: {annotation}")
+    return resolved
+
 class FunctionConverter(ConverterBase):
     """Converter for Python functions to proto definitions."""
     
@@ -45,34 +144,67 @@ class FunctionConverter(ConverterBase):
             typing.Dict: FieldDescriptor.TYPE_MESSAGE,
             typing.Optional: FieldDescriptor.TYPE_OPTIONAL,
         })
+        # Parsed specs per function; weak keys let functions be collected
+        self._spec_cache: typing.MutableMapping[
+            typing.Callable, FunctionSpec
+        ] = weakref.WeakKeyDictionary()
+        # Request/response messages by function name and signature
+        self._request_cache: typing.Dict[typing.Tuple, ProtoMessage] = {}
+        self._response_cache: typing.Dict[typing.Tuple, ProtoMessage] = {}
+        # Shared ProtoField instances by (name, type, label)
+        self._field_pool: typing.Dict[typing.Tuple, ProtoField] = {}
 
     def parse_function(self, func: typing.Callable) -> FunctionSpec:
         """Parse a function into a FunctionSpec."""
-        # Get signature
-        sig = inspect.signature(func)
+        try:
+            cached = self._spec_cache.get(func)
+        except TypeError:
+            # Not weak-referenceable; parse without caching
+            cached = None
+        if cached is not None:
+            return cached
+            
+        # Get parameters and annotations, reading them straight from the
+        # function where possible instead of building a Signature
+        params = _parameter_names(func)
+        if params is None:
+            sig = inspect.signature(func)
+            return_type = sig.return_annotation
+            annotated = [
+                (name, param.annotation)
+                for name, param in sig.parameters.items()
+            ]
+        else:
+            annotations = func.__annotations__
+            return_type = annotations.get("return", _EMPTY)
+            annotated = [
+                (name, annotations.get(name, _EMPTY)) for name in params
+            ]
         
         # Get docstring
         doc = inspect.getdoc(func) or ""
         
         # Get return type
-        return_type = sig.return_annotation
-        if return_type is inspect.Signature.empty:
+        if return_type is _EMPTY:
             raise ValidationError(f"Function {func.__name__} must have return type annotation")
         
         # Get arguments
         args = {}
-        for name, param in sig.parameters.items():
-            if param.annotation is inspect.Parameter.empty:
+        for name, annotation in annotated:
+            if annotation is _EMPTY:
                 raise ValidationError(f"Argument {name} must have type annotation")
-            args[name] = param.annotation
+            args[name] = annotation
         
-        # Check if async
-        is_async = inspect.iscoroutinefunction(func)
-        
-        # Check if generator
-        is_generator = inspect.isgeneratorfunction(func)
+        # Check if async / generator from the code flags when available
+        code = getattr(func, "__code__", None)
+        if code is not None:
+            is_async = bool(code.co_flags & _CO_COROUTINE)
+            is_generator = bool(code.co_flags & _CO_GENERATOR)
+        else:
+            is_async = inspect.iscoroutinefunction(func)
+            is_generator = inspect.isgeneratorfunction(func)
         
-        return FunctionSpec(
+        spec = FunctionSpec(
             name=func.__name__,
             args=args,
             return_type=return_type,
@@ -80,34 +212,34 @@ class FunctionConverter(ConverterBase):
             is_async=is_async,
             is_generator=is_generator,
         )
+        try:
+            self._spec_cache[func] = spec
+        except TypeError:
+            pass
+        return spec
 
     def _get_field_type_from_annotation(
         self,
         annotation: typing.Type
     ) -> typing.Tuple[typing.Type, int]:
         """Get the proto field type from a type annotation."""
-        origin = typing.get_origin(annotation)
-        args = typing.get_args(annotation)
-        
-        if origin is None:
-            return annotation, FieldDescriptor.LABEL_OPTIONAL
-        
-        if origin is typing.Union and type(None) in args:
-            # Optional type
-            return args[0], FieldDescriptor.LABEL_OPTIONAL
-        
-        if origin is list:
-            # Repeated field
-            return args[0], FieldDescriptor.LABEL_REPEATED
-        
-        if origin is dict:
-            # Map field
-            key_type, value_type = args
-            if key_type is not str:
-                raise ValidationError("Dict keys must be strings")
-            return value_type, FieldDescriptor.LABEL_REPEATED
-        
-        raise ValidationError(f"Unsupported type annotation: {annotation}")
+        return _resolve_annotation(annotation)
+
+    def _field(self, name: str, type_: typing.Type, label: int) -> ProtoField:
+        """Get a shared ProtoField for a name, type and label."""
+        key = (name, type_, label)
+        try:
+            field = self._field_pool.get(key)
+        except TypeError:
+            # Unhashable type; build an unshared field
+            return ProtoField(name=name, type=type_, label=label)
+        if field is None:
+            field = self._field_pool[key] = ProtoField(
+                name=name,
+                type=type_,
+                label=label,
+            )
+        return field
 
     def create_message_from_type(
         self,
@@ -120,17 +252,13 @@ class FunctionConverter(ConverterBase):
             fields = []
             for field_name, field_type in type_hint.__annotations__.items():
                 base_type, label = self._get_field_type_from_annotation(field_type)
-                fields.append(ProtoField(
-                    name=field_name,
-                    type=base_type,
-                    label=label,
-                ))
+                fields.append(self._field(field_name, base_type, label))
             return ProtoMessage(name=name, fields=fields)
         else:
             # Create message from simple type
             return ProtoMessage(
                 name=name,
-                fields=[ProtoField(name="value", type=type_hint)],
+                fields=[self._field("value", type_hint, _LABEL_OPTIONAL)],
             )
 
     def create_request_message(
@@ -138,33 +266,49 @@ class FunctionConverter(ConverterBase):
         func_spec: FunctionSpec
     ) -> ProtoMessage:
         """Create a request message from a function spec."""
+        key = (func_spec.name, tuple(func_spec.args.items()))
+        try:
+            cached = self._request_cache.get(key)
+        except TypeError:
+            # Unhashable annotation; build without caching
+            key, cached = None, None
+        if cached is not None:
+            return cached
+            
         fields = []
         for arg_name, arg_type in func_spec.args.items():
             base_type, label = self._get_field_type_from_annotation(arg_type)
-            fields.append(ProtoField(
-                name=arg_name,
-                type=base_type,
-                label=label,
-            ))
-        return ProtoMessage(
+            fields.append(self._field(arg_name, base_type, label))
+        message = ProtoMessage(
             name=f"{func_spec.name}Request",
             fields=fields,
         )
+        if key is not None:
+            self._request_cache[key] = message
+        return message
 
     def create_response_message(
         self,
         func_spec: FunctionSpec
     ) -> ProtoMessage:
         """Create a response message from a function spec."""
+        key = (func_spec.name, func_spec.return_type)
+        try:
+            cached = self._response_cache.get(key)
+        except TypeError:
+            # Unhashable annotation; build without caching
+            key, cached = None, None
+        if cached is not None:
+            return cached
+            
         base_type, label = self._get_field_type_from_annotation(func_spec.return_type)
-        return ProtoMessage(
+        message = ProtoMessage(
             name=f"{func_spec.name}Response",
-            fields=[ProtoField(
-                name="result",
-                type=base_type,
-                label=label,
-            )],
+            fields=[self._field("result", base_type, label)],
         )
+        if key is not None:
+            self._response_cache[key] = message
+        return message
 
     def function_to_service(
         self,
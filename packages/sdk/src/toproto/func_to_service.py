@@ -15,11 +15,11 @@ import inspect
 from dataclasses import dataclass
 from google.protobuf.descriptor import ServiceDescriptor
 
-from .converter_base import ProtoService, ProtoMethod
+from .converter_base import _DATACLASS_OPTIONS, ProtoService, ProtoMethod
 from .func_to_proto import FunctionConverter, FunctionSpec
 from ..client.exceptions import ValidationError
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ServiceSpec:
     """Service specification for gRPC generation."""
     name: str
@@ -34,6 +34,31 @@ class ServiceConverter(FunctionConverter):
         super().__init__()
         self._services: typing.Dict[str, ServiceSpec] = {}
 
+    def _method_specs(self, cls: typing.Type) -> typing.List[FunctionSpec]:
+        """Parse the public, fully annotated functions of a class."""
+        # Collect public functions through the MRO, nearest definition
+        # first, without triggering descriptors on every attribute
+        functions = {}
+        for klass in cls.__mro__[:-1]:
+            for method_name, method in vars(klass).items():
+                if method_name.startswith("_") or method_name in functions:
+                    continue
+                if isinstance(method, staticmethod):
+                    method = method.__func__
+                functions[method_name] = method
+        
+        methods = []
+        for method_name in sorted(functions):
+            method = functions[method_name]
+            if not inspect.isfunction(method):
+                continue
+            try:
+                methods.append(self.parse_function(method))
+            except ValidationError:
+                # Skip methods without proper type annotations
+                continue
+        return methods
+
     def parse_service(
         self,
         cls: typing.Type,
@@ -46,52 +71,40 @@ class ServiceConverter(FunctionConverter):
         # Get docstring
         doc = inspect.getdoc(cls) or ""
         
-        # Get methods
-        methods = []
-        for method_name, method in inspect.getmembers(cls, inspect.isfunction):
-            if not method_name.startswith("_"):
-                try:
-                    methods.append(self.parse_function(method))
-                except ValidationError:
-                    # Skip methods without proper type annotations
-                    continue
-        
         return ServiceSpec(
             name=name,
-            methods=methods,
+            methods=self._method_specs(cls),
             docstring=doc,
         )
 
+    def _create_method(self, func_spec: FunctionSpec) -> ProtoMethod:
+        """Add request/response messages for a function and create its method."""
+        # Create request/response messages
+        request_msg = self.create_request_message(func_spec)
+        response_msg = self.create_response_message(func_spec)
+        
+        # Add messages
+        self.add_message(request_msg)
+        self.add_message(response_msg)
+        
+        return ProtoMethod(
+            name=func_spec.name,
+            input_type=request_msg.name,
+            output_type=response_msg.name,
+            client_streaming=False,
+            server_streaming=func_spec.is_generator,
+        )
+
     def create_service_from_functions(
         self,
         functions: typing.List[typing.Callable],
         service_name: str
     ) -> ProtoService:
         """Create a service from a list of functions."""
-        methods = []
-        
-        for func in functions:
-            # Parse function
-            func_spec = self.parse_function(func)
-            
-            # Create request/response messages
-            request_msg = self.create_request_message(func_spec)
-            response_msg = self.create_response_message(func_spec)
-            
-            # Add messages
-            self.add_message(request_msg)
-            self.add_message(response_msg)
-            
-            # Create method
-            method = ProtoMethod(
-                name=func_spec.name,
-                input_type=request_msg.name,
-                output_type=response_msg.name,
-                client_streaming=False,
-                server_streaming=func_spec.is_generator,
-            )
-            methods.append(method)
-        
+        methods = [
+            self._create_method(self.parse_function(func))
+            for func in functions
+        ]
         return ProtoService(name=service_name, methods=methods)
 
     def create_service_from_class(
@@ -100,30 +113,11 @@ class ServiceConverter(FunctionConverter):
         service_name: str = None
     ) -> ProtoService:
         """Create a service from a class."""
-        # Parse service
-        service_spec = self.parse_service(cls, service_name)
-        
-        methods = []
-        for method_spec in service_spec.methods:
-            # Create request/response messages
-            request_msg = self.create_request_message(method_spec)
-            response_msg = self.create_response_message(method_spec)
-            
-            # Add messages
-            self.add_message(request_msg)
-            self.add_message(response_msg)
-            
-            # Create method
-            method = ProtoMethod(
-                name=method_spec.name,
-                input_type=request_msg.name,
-                output_type=response_msg.name,
-                client_streaming=False,
-                server_streaming=method_spec.is_generator,
-            )
-            methods.append(method)
-        
-        return ProtoService(name=service_spec.name, methods=methods)
+        methods = [
+            self._create_method(method_spec)
+            for method_spec in self._method_specs(cls)
+        ]
+        return ProtoService(name=service_name or cls.__name__, methods=methods)
 
     def create_service_descriptor(
         self,
@@ -167,11 +161,10 @@ class ServiceConverter(FunctionConverter):
         # Add messages
         for message in self._messages.values():
             desc = self.create_message_descriptor(message, self._package)
-            output.append(str(desc))
+            output.append(self._desc_str(desc))
         
         # Add services
         for service in self._services.values():
-            desc = self.create_service_descriptor(service, self._package)
-            output.append(str(desc))
+            output.append(self._desc_str(self._service_descriptor(service)))
         
         return "\n".join(output) 
\ No newline at end of file
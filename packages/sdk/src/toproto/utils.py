@@ -10,10 +10,11 @@ Features:
 """
 
 import re
-from typing import Any, List, Type
+from typing import Any, Sequence, Type
 from google.protobuf.descriptor import (
     Descriptor,
-    FieldDescriptor
+    FieldDescriptor,
+    FileDescriptor
 )
 
 # Type mapping from Python to Proto
@@ -40,15 +41,45 @@ PROTO_TO_PYTHON_TYPES = {
     FieldDescriptor.TYPE_ENUM: int,
 }
 
+# Default values by proto field type; unmapped types default to None
+_FIELD_DEFAULTS = {
+    FieldDescriptor.TYPE_DOUBLE: 0,
+    FieldDescriptor.TYPE_FLOAT: 0,
+    FieldDescriptor.TYPE_INT64: 0,
+    FieldDescriptor.TYPE_UINT64: 0,
+    FieldDescriptor.TYPE_INT32: 0,
+    FieldDescriptor.TYPE_UINT32: 0,
+    FieldDescriptor.TYPE_BOOL: False,
+    FieldDescriptor.TYPE_STRING: "",
+    FieldDescriptor.TYPE_BYTES: b"",
+    FieldDescriptor.TYPE_ENUM: 0,
+}
+
+# Positions before an uppercase letter, other than the start
+_CAMEL_TO_SNAKE_SUB = re.compile(r'(?<!^)(?=[A-Z])').sub
+
+# Proto identifiers: an ASCII letter followed by letters, digits or "_"
+_PROTO_IDENT_MATCH = re.compile(r'[A-Za-z][A-Za-z0-9_]*').fullmatch
+
+# Proto3 reserved words
+_PROTO_RESERVED = frozenset({
+    'syntax', 'import', 'weak', 'public', 'package', 'option', 'repeated',
+    'oneof', 'map', 'reserved', 'to', 'max', 'enum', 'message', 'service',
+    'rpc', 'stream', 'returns', 'true', 'false'
+})
+
 def snake_to_camel(name: str) -> str:
     """Convert snake_case to camelCase."""
-    components = name.split('_')
-    return components[0] + ''.join(x.title() for x in components[1:])
+    head, sep, tail = name.partition('_')
+    if not sep:
+        return name
+    # "_" is a word boundary for str.title, so title-casing the tail as a
+    # whole matches title-casing each component
+    return head + tail.title().replace('_', '')
 
 def camel_to_snake(name: str) -> str:
     """Convert camelCase to snake_case."""
-    pattern = re.compile(r'(?<!^)(?=[A-Z])')
-    return pattern.sub('_', name).lower()
+    return _CAMEL_TO_SNAKE_SUB('_', name).lower()
 
 def validate_proto_name(name: str) -> bool:
     """
@@ -59,25 +90,16 @@ def validate_proto_name(name: str) -> bool:
     - Can contain letters, numbers, underscores
     - Cannot use proto3 reserved words
     """
-    if not name or not name[0].isalpha():
-        return False
-        
-    if not all(c.isalnum() or c == '_' for c in name):
+    if not name or not _PROTO_IDENT_MATCH(name):
         return False
         
-    # Proto3 reserved words
-    reserved = {
-        'syntax', 'import', 'weak', 'public', 'package', 'option', 'repeated',
-        'oneof', 'map', 'reserved', 'to', 'max', 'enum', 'message', 'service',
-        'rpc', 'stream', 'returns', 'true', 'false'
-    }
-    
-    return name.lower() not in reserved
+    return name.lower() not in _PROTO_RESERVED
 
 def get_field_type(python_type: Type) -> int:
     """Get protocol buffer field type for Python type."""
-    if python_type in PYTHON_TO_PROTO_TYPES:
-        return PYTHON_TO_PROTO_TYPES[python_type]
+    field_type = PYTHON_TO_PROTO_TYPES.get(python_type)
+    if field_type is not None:
+        return field_type
     
     if hasattr(python_type, 'DESCRIPTOR'):
         return FieldDescriptor.TYPE_MESSAGE
@@ -89,36 +111,15 @@ def get_field_type(python_type: Type) -> int:
 
 def get_python_type(field_type: int) -> Type:
     """Get Python type for protocol buffer field type."""
-    if field_type in PROTO_TO_PYTHON_TYPES:
-        return PROTO_TO_PYTHON_TYPES[field_type]
+    python_type = PROTO_TO_PYTHON_TYPES.get(field_type)
+    if python_type is not None:
+        return python_type
         
     raise ValueError(f"Cannot map proto type {field_type} to Python type")
 
 def get_field_default(field_type: int) -> Any:
     """Get default value for protocol buffer field type."""
-    if field_type in {
-        FieldDescriptor.TYPE_DOUBLE,
-        FieldDescriptor.TYPE_FLOAT,
-        FieldDescriptor.TYPE_INT64,
-        FieldDescriptor.TYPE_UINT64,
-        FieldDescriptor.TYPE_INT32,
-        FieldDescriptor.TYPE_UINT32,
-    }:
-        return 0
-        
-    if field_type == FieldDescriptor.TYPE_BOOL:
-        return False
-        
-    if field_type == FieldDescriptor.TYPE_STRING:
-        return ""
-        
-    if field_type == FieldDescriptor.TYPE_BYTES:
-        return b""
-        
-    if field_type == FieldDescriptor.TYPE_ENUM:
-        return 0
-        
-    return None
+    return _FIELD_DEFAULTS.get(field_type)
 
 def is_message_type(python_type: Type) -> bool:
     """Check if a Python type represents a protocol buffer message."""
@@ -128,17 +129,27 @@ def is_enum_type(python_type: Type) -> bool:
     """Check if a Python type represents a protocol buffer enum."""
     return hasattr(python_type, '_values_')
 
-def get_message_fields(desc: Descriptor) -> List[FieldDescriptor]:
-    """Get all fields from a message descriptor."""
-    return list(desc.fields)
-
-def get_nested_messages(desc: Descriptor) -> List[Descriptor]:
-    """Get all nested message types from a message descriptor."""
-    return list(desc.nested_types)
-
-def get_nested_enums(desc: Descriptor) -> List[Descriptor]:
-    """Get all nested enum types from a message descriptor."""
-    return list(desc.enum_types)
+def get_message_fields(desc: Descriptor) -> Sequence[FieldDescriptor]:
+    """Get all fields from a message descriptor (read-only, not copied)."""
+    return desc.fields
+
+def get_field_label(field: FieldDescriptor) -> int:
+    """Get a field's LABEL_* value; protobuf 7 drops field.label."""
+    if hasattr(field, "is_repeated"):
+        if field.is_repeated:
+            return FieldDescriptor.LABEL_REPEATED
+        if field.is_required:
+            return FieldDescriptor.LABEL_REQUIRED
+        return FieldDescriptor.LABEL_OPTIONAL
+    return field.label
+
+def get_nested_messages(desc: Descriptor) -> Sequence[Descriptor]:
+    """Get all nested message types from a message descriptor (read-only)."""
+    return desc.nested_types
+
+def get_nested_enums(desc: Descriptor) -> Sequence[Descriptor]:
+    """Get all nested enum types from a message descriptor (read-only)."""
+    return desc.enum_types
 
 def get_package_name(desc: FileDescriptor) -> str:
     """
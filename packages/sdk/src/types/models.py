@@ -12,19 +12,141 @@ Features:
 """
 
 import base64
+import binascii
+import functools
 import os
 import shutil
+import stat
+import sys
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 from ..platform import sdk_pb2
 from ..client.exceptions import ValidationError
 
+try:
+    import pybase64 as _base64
+except ImportError:  # optional: faster decoding of large base64 images
+    _base64 = base64
+
+# Base64 characters decoded per chunk when saving; a multiple of 4 so each
+# chunk holds whole 4-character groups
+_BASE64_CHUNK = 1 << 16
+
+# Write buffer for files saved in chunks: one write syscall per MiB
+_WRITE_BUFFER = 1 << 20
+
+# Downloads up to this size, by Content-Length, are read and written whole
+_SMALL_DOWNLOAD = 16 << 20
+
+def _write_base64(f: typing.BinaryIO, data: str) -> None:
+    """Decode base64 data into a binary file, chunk by chunk."""
+    if len(data) > _BASE64_CHUNK:
+        try:
+            for start in range(0, len(data), _BASE64_CHUNK):
+                chunk = data[start:start + _BASE64_CHUNK]
+                f.write(_base64.b64decode(chunk, validate=True))
+            return
+        except binascii.Error:
+            # Whitespace or other characters the lenient decoder skips
+            # break the chunk alignment; decode the data in one piece
+            f.seek(0)
+            f.truncate()
+    f.write(_base64.b64decode(data))
+
+@functools.lru_cache(maxsize=256)
+def _ensure_dir(directory: str) -> None:
+    """Create a directory, once per process for each path."""
+    os.makedirs(directory, exist_ok=True)
+
+def _open_for_write(destination: str, buffering: int = -1) -> typing.BinaryIO:
+    """Open a file for binary writing, creating its directory if needed."""
+    directory = os.path.dirname(destination)
+    if not directory:
+        return open(destination, "wb", buffering=buffering)
+    _ensure_dir(directory)
+    try:
+        return open(destination, "wb", buffering=buffering)
+    except FileNotFoundError:
+        # Directory removed since it was first created
+        os.makedirs(directory, exist_ok=True)
+        return open(destination, "wb", buffering=buffering)
+
+# Metadata dataclasses are slotted where dataclass supports it (3.10+)
+_DATACLASS_OPTIONS: typing.Dict[str, typing.Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+def _cache_field_names(cls: type) -> type:
+    """Class decorator caching a dataclass's field names as _field_names."""
+    cls._field_names = tuple(f.name for f in fields(cls))
+    return cls
+
+def _validator_source(name: str, metadata: typing.Mapping) -> typing.List[str]:
+    """Get the validate() source lines for one field's constraints."""
+    attr = f"self.{name}"
+    lines = []
+    if "validator" in metadata:
+        lines.append(f"    _validate_{name}({attr})")
+    if "required" in metadata:
+        lines.append(f"    if not {attr}:")
+        lines.append(f"        raise ValueError({metadata['required']!r})")
+    if metadata.get("positive"):
+        lines.append(f"    if {attr} is not None and {attr} <= 0:")
+        lines.append(f"        raise ValueError({name + ' must be positive'!r})")
+    if "range" in metadata:
+        low, high = metadata["range"]
+        message = f"{name} must be between {low} and {high}"
+        lines.append(f"    if not {low!r} <= {attr} <= {high!r}:")
+        lines.append(f"        raise ValueError({message!r})")
+    return lines
+
+def validated_dataclass(cls: type) -> type:
+    """
+    Dataclass decorator generating validate() from field metadata.
+    
+    Constraints are read from each field's metadata, in field order:
+    - "validator": callable run on the value first
+    - "required": error message raised when the value is falsy
+    - "positive": values that are not None must be greater than 0
+    - "range": (low, high) inclusive bounds
+    
+    The checks are compiled once per class into a single function, so
+    validate() runs them as straight-line code.
+    """
+    cls = dataclass(**_DATACLASS_OPTIONS)(cls)
+    namespace: typing.Dict[str, typing.Any] = {}
+    lines = ["def validate(self):"]
+    for f in fields(cls):
+        if "validator" in f.metadata:
+            namespace[f"_validate_{f.name}"] = f.metadata["validator"]
+        lines.extend(_validator_source(f.name, f.metadata))
+    if len(lines) == 1:
+        lines.append("    pass")
+        
+    exec(compile("\n".join(lines), f"<validate {cls.__qualname__}>", "exec"), namespace)
+    validate = namespace["validate"]
+    validate.__qualname__ = f"{cls.__qualname__}.validate"
+    validate.__doc__ = "Validate field values."
+    cls.validate = validate
+    return cls
+
+# TruffleReturnType and every subclass, for O(1) return type checks
+_ALLOWED_RETURN_TYPES: typing.Set[type] = set()
+
 class TruffleReturnType:
     """Base class for all Truffle return types."""
+    __truffle_proto_type__ = sdk_pb2.TruffleType.TRUFFLE_UNSPECIFIED
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _ALLOWED_RETURN_TYPES.add(cls)
+
     def __init__(self, type: sdk_pb2.TruffleType):
         self.type = type
 
+_ALLOWED_RETURN_TYPES.add(TruffleReturnType)
+
 class TruffleFile(TruffleReturnType):
     """
     Represents a file in the Truffle system with enhanced validation.
@@ -35,6 +157,7 @@ class TruffleFile(TruffleReturnType):
     - Comprehensive error handling
     - File metadata preservation
     """
+    __truffle_proto_type__ = sdk_pb2.TruffleType.TRUFFLE_FILE
     
     def __init__(self, path: typing.Union[str, Path], name: str = None):
         """
@@ -47,8 +170,9 @@ class TruffleFile(TruffleReturnType):
         Raises:
             ValidationError: If file validation fails
         """
-        super().__init__(sdk_pb2.TruffleType.TRUFFLE_TYPE_FILE)
-        self.path = Path(path).resolve()
+        super().__init__(self.__truffle_proto_type__)
+        # Absolute but not symlink-resolved; see resolved for the real path
+        self.path = Path(os.path.abspath(path))
         self.name = name or self.path.name
         self._validate()
 
@@ -59,13 +183,20 @@ class TruffleFile(TruffleReturnType):
         Raises:
             ValidationError: If validation fails
         """
-        if not self.path.exists():
+        try:
+            self._stat = os.stat(self.path)
+        except OSError:
             raise ValidationError(f"File not found: {self.path}")
-        if not self.path.is_file():
+        if not stat.S_ISREG(self._stat.st_mode):
             raise ValidationError(f"Not a file: {self.path}")
         if not os.access(self.path, os.R_OK):
             raise ValidationError(f"File not readable: {self.path}")
 
+    @functools.cached_property
+    def resolved(self) -> Path:
+        """Get the canonical path with symlinks resolved."""
+        return self.path.resolve()
+
     def __repr__(self) -> str:
         """Get string representation."""
         return f"TruffleFile(path='{self.path}', name='{self.name}')"
@@ -85,10 +216,15 @@ class TruffleFile(TruffleReturnType):
         """
         try:
             dest_path = Path(destination).resolve()
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(str(dest_path.parent))
             
             # Copy with metadata preservation
-            shutil.copy2(self.path, dest_path)
+            try:
+                shutil.copy2(self.path, dest_path)
+            except FileNotFoundError:
+                # Directory removed since it was first created
+                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(self.path, dest_path)
             
             return str(dest_path)
             
@@ -97,8 +233,8 @@ class TruffleFile(TruffleReturnType):
 
     @property
     def size(self) -> int:
-        """Get file size in bytes."""
-        return self.path.stat().st_size
+        """Get file size in bytes, as of validation."""
+        return self._stat.st_size
 
     @property
     def extension(self) -> str:
@@ -140,6 +276,8 @@ class TruffleFile(TruffleReturnType):
 
 class TruffleImage(TruffleReturnType):
     """Represents an image in the Truffle system."""
+    __truffle_proto_type__ = sdk_pb2.TruffleType.TRUFFLE_IMAGE
+
     def __init__(
         self, 
         name: str, 
@@ -147,13 +285,13 @@ class TruffleImage(TruffleReturnType):
         base64_data: str = None, 
         data: bytes = None
     ):
-        super().__init__(sdk_pb2.TruffleType.TRUFFLE_TYPE_IMAGE)
+        super().__init__(self.__truffle_proto_type__)
         self.name = name
         self.url = url
         self.base64_data = base64_data
         self.data = data
 
-        if not any([url, base64_data, data]):
+        if not (url or base64_data or data):
             raise ValueError("Must provide either url, base64_data, or data")
 
     def __repr__(self) -> str:
@@ -169,24 +307,35 @@ class TruffleImage(TruffleReturnType):
         Returns:
             The path where the image was saved
         """
-        os.makedirs(os.path.dirname(destination), exist_ok=True)
-        
         if self.data:
-            with open(destination, "wb") as f:
+            with _open_for_write(destination) as f:
                 f.write(self.data)
         elif self.base64_data:
-            with open(destination, "wb") as f:
-                f.write(base64.b64decode(self.base64_data))
+            with _open_for_write(destination, _WRITE_BUFFER) as f:
+                _write_base64(f, self.base64_data)
         elif self.url:
+            # Imported here so importing the SDK doesn't load requests
+            import requests
+            
             response = requests.get(self.url, stream=True)
             response.raise_for_status()
-            with open(destination, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            try:
+                length = int(response.headers.get("Content-Length", ""))
+            except ValueError:
+                length = -1
+            if 0 <= length <= _SMALL_DOWNLOAD:
+                with _open_for_write(destination) as f:
+                    f.write(response.content)
+            else:
+                # Let urllib3 undo any Content-Encoding, as iter_content did
+                response.raw.decode_content = True
+                with _open_for_write(destination, _WRITE_BUFFER) as f:
+                    shutil.copyfileobj(response.raw, f, 1 << 17)
         
         return destination
 
-@dataclass
+@_cache_field_names
+@dataclass(**_DATACLASS_OPTIONS)
 class ToolMetadata:
     """Metadata for a registered tool."""
     name: str
@@ -209,7 +358,7 @@ class ToolRegistry:
         if not hasattr(func, "__truffle_tool__"):
             raise ValueError(f"Function {func.__name__} is not decorated as a tool")
         
-        name = metadata.name or func.__name__
+        name = sys.intern(metadata.name or func.__name__)
         if name in self.tools:
             raise ValueError(f"Tool {name} is already registered")
 
@@ -226,7 +375,8 @@ class ToolRegistry:
         """List all registered tools."""
         return list(self.tools.values())
 
-@dataclass
+@_cache_field_names
+@dataclass(**_DATACLASS_OPTIONS)
 class AppMetadata:
     """Metadata for a Truffle application."""
     fullname: str
@@ -255,10 +405,15 @@ def to_proto_type(obj: TruffleReturnType) -> sdk_pb2.TruffleType:
     """Convert a Truffle return type to its proto enum value."""
     return obj.type
 
+# Return type classes indexed by TruffleType enum value
+_PROTO_TYPE_CLASSES = [TruffleReturnType] * (max(sdk_pb2.TruffleType.values()) + 1)
+for _cls in (TruffleFile, TruffleImage):
+    _PROTO_TYPE_CLASSES[_cls.__truffle_proto_type__] = _cls
+_PROTO_TYPE_CLASSES = tuple(_PROTO_TYPE_CLASSES)
+del _cls
+
 def from_proto_type(type_enum: sdk_pb2.TruffleType) -> typing.Type[TruffleReturnType]:
     """Get the appropriate Truffle return type class from a proto enum value."""
-    type_map = {
-        sdk_pb2.TruffleType.TRUFFLE_FILE: TruffleFile,
-        sdk_pb2.TruffleType.TRUFFLE_IMAGE: TruffleImage,
-    }
-    return type_map.get(type_enum, TruffleReturnType)
+    if 0 <= type_enum < len(_PROTO_TYPE_CLASSES):
+        return _PROTO_TYPE_CLASSES[type_enum]
+    return TruffleReturnType
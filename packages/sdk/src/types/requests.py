@@ -12,37 +12,34 @@ Features:
 - EmbedRequest: Text embedding generation
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 
 from ..tools.utils import validate_tool_args
+from .models import (
+    _DATACLASS_OPTIONS,
+    _cache_field_names,
+    validated_dataclass,
+)
 
-@dataclass
+_VALID_TOOL_STATUSES = frozenset({"started", "completed", "failed", "cancelled"})
+
+@_cache_field_names
+@validated_dataclass
 class GenerateRequest:
     """Request for model generation."""
-    prompt: str
-    model: str
-    max_tokens: Optional[int] = None
-    temperature: float = 0.7
-    top_p: float = 1.0
+    prompt: str = field(metadata={"required": "Prompt cannot be empty"})
+    model: str = field(metadata={"required": "Model must be specified"})
+    max_tokens: Optional[int] = field(default=None, metadata={"positive": True})
+    temperature: float = field(default=0.7, metadata={"range": (0, 2)})
+    top_p: float = field(default=1.0, metadata={"range": (0, 1)})
     stop: Optional[List[str]] = None
     stream: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def validate(self) -> None:
-        """Validate request parameters."""
-        if not self.prompt:
-            raise ValueError("Prompt cannot be empty")
-        if not self.model:
-            raise ValueError("Model must be specified")
-        if self.max_tokens is not None and self.max_tokens <= 0:
-            raise ValueError("max_tokens must be positive")
-        if not 0 <= self.temperature <= 2:
-            raise ValueError("temperature must be between 0 and 2")
-        if not 0 <= self.top_p <= 1:
-            raise ValueError("top_p must be between 0 and 1")
-
-@dataclass
+@_cache_field_names
+@dataclass(**_DATACLASS_OPTIONS)
 class GetModelsRequest:
     """Request to get available models."""
     include_hidden: bool = False
@@ -51,36 +48,51 @@ class GetModelsRequest:
         """Validate request parameters."""
         pass  # No validation needed
 
-@dataclass
+@_cache_field_names
+@dataclass(**_DATACLASS_OPTIONS)
 class SystemToolRequest:
     """Request for system tool operations."""
     tool_name: str
     args: Dict[str, Any]
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Tool names are looked up by key; interning makes matches identity checks
+        if type(self.tool_name) is str:
+            self.tool_name = sys.intern(self.tool_name)
+
     def validate(self) -> None:
         """Validate request parameters."""
         if not self.tool_name:
             raise ValueError("Tool name cannot be empty")
         validate_tool_args(self.tool_name, self.args)
 
-@dataclass
+@_cache_field_names
+@dataclass(**_DATACLASS_OPTIONS)
 class ToolUpdateRequest:
     """Request to update tool status."""
     tool_name: str
     status: str
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Names and statuses repeat across updates; share one copy of each
+        if type(self.tool_name) is str:
+            self.tool_name = sys.intern(self.tool_name)
+        if type(self.status) is str:
+            self.status = sys.intern(self.status)
+
     def validate(self) -> None:
         """Validate request parameters."""
         if not self.tool_name:
             raise ValueError("Tool name cannot be empty")
         if not self.status:
             raise ValueError("Status cannot be empty")
-        if self.status not in {"started", "completed", "failed", "cancelled"}:
+        if self.status not in _VALID_TOOL_STATUSES:
             raise ValueError("Invalid status")
 
-@dataclass
+@_cache_field_names
+@dataclass(**_DATACLASS_OPTIONS)
 class UserRequest:
     """Request for user interaction."""
     prompt: str
@@ -95,24 +107,29 @@ class UserRequest:
         if self.timeout is not None and self.timeout <= 0:
             raise ValueError("Timeout must be positive")
 
-@dataclass
+def _validate_embed_text(text: Union[str, List[str]]) -> None:
+    """Validate the text of an EmbedRequest."""
+    if isinstance(text, str):
+        if not text:
+            raise ValueError("Text cannot be empty")
+    elif isinstance(text, list):
+        if not text:
+            raise ValueError("Text list cannot be empty")
+        # Check the distinct element types, then emptiness, in C loops
+        text_types = set(map(type, text))
+        text_types.discard(str)
+        if not all(issubclass(t, str) for t in text_types) or not all(text):
+            raise ValueError("All texts must be non-empty strings")
+    else:
+        raise TypeError("Text must be string or list of strings")
+
+@_cache_field_names
+@validated_dataclass
 class EmbedRequest:
     """Request for text embedding."""
-    text: Union[str, List[str]]
-    model: str = "text-embedding-ada-002"
+    text: Union[str, List[str]] = field(metadata={"validator": _validate_embed_text})
+    model: str = field(
+        default="text-embedding-ada-002",
+        metadata={"required": "Model must be specified"},
+    )
     metadata: Dict[str, Any] = field(default_factory=dict)
-
-    def validate(self) -> None:
-        """Validate request parameters."""
-        if isinstance(self.text, str):
-            if not self.text:
-                raise ValueError("Text cannot be empty")
-        elif isinstance(self.text, list):
-            if not self.text:
-                raise ValueError("Text list cannot be empty")
-            if not all(isinstance(t, str) and t for t in self.text):
-                raise ValueError("All texts must be non-empty strings")
-        else:
-            raise TypeError("Text must be string or list of strings")
-        if not self.model:
-            raise ValueError("Model must be specified")
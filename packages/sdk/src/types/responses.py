@@ -15,7 +15,12 @@ Features:
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-@dataclass
+from .models import _DATACLASS_OPTIONS, _cache_field_names
+
+_VALID_FINISH_REASONS = frozenset({None, "stop", "length", "content_filter"})
+
+@_cache_field_names
+@dataclass(**_DATACLASS_OPTIONS)
 class GenerateResponse:
     """Response from model generation."""
     text: str
@@ -30,10 +35,11 @@ class GenerateResponse:
             raise ValueError("Response text cannot be empty")
         if not self.model:
             raise ValueError("Model must be specified")
-        if self.finish_reason not in {None, "stop", "length", "content_filter"}:
+        if self.finish_reason not in _VALID_FINISH_REASONS:
             raise ValueError("Invalid finish_reason")
 
-@dataclass
+@_cache_field_names
+@dataclass(**_DATACLASS_OPTIONS)
 class GetModelsResponse:
     """Response containing available models."""
     models: List[Dict[str, Any]]
@@ -49,7 +55,8 @@ class GetModelsResponse:
             if "id" not in model:
                 raise ValueError("Each model must have an id")
 
-@dataclass
+@_cache_field_names
+@dataclass(**_DATACLASS_OPTIONS)
 class SystemToolResponse:
     """Response from system tool operations."""
     tool_name: str
@@ -64,7 +71,8 @@ class SystemToolResponse:
         if self.error and not isinstance(self.error, str):
             raise TypeError("Error must be a string")
 
-@dataclass
+@_cache_field_names
+@dataclass(**_DATACLASS_OPTIONS)
 class SDKResponse:
     """Generic SDK response."""
     success: bool
@@ -82,7 +90,8 @@ class SDKResponse:
         if self.error and not isinstance(self.error, str):
             raise TypeError("Error must be a string")
 
-@dataclass
+@_cache_field_names
+@dataclass(**_DATACLASS_OPTIONS)
 class UserResponse:
     """Response from user interaction."""
     response: str
@@ -97,7 +106,8 @@ class UserResponse:
         if self.cancelled and self.timeout:
             raise ValueError("Response cannot be both cancelled and timed out")
 
-@dataclass
+@_cache_field_names
+@dataclass(**_DATACLASS_OPTIONS)
 class EmbedResponse:
     """Response from text embedding."""
     embeddings: List[List[float]]